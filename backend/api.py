@@ -8,11 +8,16 @@ Provides REST API endpoints for:
 - Document submission to Deriv (mock)
 """
 
+import asyncio
 import time
 import base64
+from functools import lru_cache
 from typing import Optional
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+
+import orjson
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from config.settings import settings
@@ -26,7 +31,8 @@ from config.document_schema import DocumentType, DocumentSide, IssueSeverity
 app = FastAPI(
     title="KYC Document Analysis API",
     description="AI-powered document verification for Deriv onboarding",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson encoder instead of stdlib json
 )
 
 # CORS middleware for frontend
@@ -107,66 +113,49 @@ class HealthResponse(BaseModel):
 @app.get("/", response_model=HealthResponse)
 async def root():
     """Health check endpoint."""
-    return HealthResponse(
-        status="healthy",
-        api_version="1.0.0",
-        gemini_configured=bool(settings.GEMINI_API_KEY)
-    )
+    return Response(_health_payload(), media_type="application/json")
 
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
-    return HealthResponse(
-        status="healthy",
-        api_version="1.0.0",
-        gemini_configured=bool(settings.GEMINI_API_KEY)
-    )
+    return Response(_health_payload(), media_type="application/json")
 
 
 @app.get("/countries")
 async def get_countries():
     """Get list of supported countries."""
-    from config.deriv_context import get_supported_countries
-    
-    countries = get_supported_countries()
-    return {
-        "success": True,
-        "countries": countries
-    }
+    return Response(_countries_payload(), media_type="application/json")
 
 
 @app.get("/documents/{country_code}")
 async def get_documents(country_code: str):
     """Get supported documents for a country."""
-    from config.deriv_context import DerivContextResolver
+    payload = _documents_payload(country_code)
     
-    resolver = DerivContextResolver()
-    documents = resolver.get_documents(country_code)
-    
-    if not documents:
+    if payload is None:
         raise HTTPException(status_code=404, detail=f"Country {country_code} not found")
         
-    return {
-        "success": True,
-        "country_code": country_code,
-        "documents": documents
-    }
+    return Response(payload, media_type="application/json")
 
 
-@app.post("/analyze", response_model=AnalysisResponse)
-async def analyze_document(request: AnalyzeRequest):
+async def _analyze_image(
+    image_bytes: bytes,
+    document_type: str,
+    country_code: str,
+    side: str,
+    attempt: int,
+    start_time: float
+) -> ORJSONResponse:
     """
-    Analyze a document image and return issues/guidance.
+    Analyze raw document image bytes and return issues/guidance.
     
-    This is the main endpoint that:
+    Shared by the JSON and multipart endpoints:
     1. Processes the image
     2. Runs vision analysis
     3. Detects issues
     4. Generates guidance
     """
-    start_time = time.time()
-    
     try:
         # Import modules
         from backend.image_processor import process_document_image
@@ -181,17 +170,11 @@ async def analyze_document(request: AnalyzeRequest):
         from backend.issue_prioritizer import format_issues_for_display
         from config.deriv_context import get_document_requirements
         
-        # Decode base64 image
-        try:
-            image_bytes = base64.b64decode(request.image_base64)
-        except Exception:
-            raise HTTPException(status_code=400, detail="Invalid base64 image data")
-            
         # Process image
         processed_image, image_quality = process_document_image(image_bytes)
         
         if processed_image is None:
-            return AnalysisResponse(
+            return _model_response(AnalysisResponse(
                 success=False,
                 score=0,
                 is_ready=False,
@@ -207,13 +190,13 @@ async def analyze_document(request: AnalyzeRequest):
                 encouragement="Let's try again!",
                 severity_level="high",
                 processing_time_ms=int((time.time() - start_time) * 1000)
-            )
+            ))
             
         # Run vision analysis
         vision_result = await vision_analyze_async(
             processed_image,
-            request.document_type,
-            request.country_code
+            document_type,
+            country_code
         )
         
         # Detect issues
@@ -221,10 +204,10 @@ async def analyze_document(request: AnalyzeRequest):
         issues = detector.detect_issues(
             vision_result=vision_result,
             image_quality=image_quality,
-            country_code=request.country_code,
-            document_type=request.document_type,
-            document_side=request.side,
-            sides_uploaded=[request.side]
+            country_code=country_code,
+            document_type=document_type,
+            document_side=side,
+            sides_uploaded=[side]
         )
         
         # Check if OCR extracted any real data
@@ -250,13 +233,13 @@ async def analyze_document(request: AnalyzeRequest):
         is_ready = is_deriv_ready(prioritized)
         
         # Generate guidance
-        country_name = get_country_name(request.country_code)
+        country_name = get_country_name(country_code)
         guidance_result = generate_guidance(
             issues=prioritized,
-            document_type=request.document_type,
+            document_type=document_type,
             country_name=country_name,
-            document_side=request.side,
-            attempt=request.attempt
+            document_side=side,
+            attempt=attempt
         )
         
         # Format issues for response
@@ -274,7 +257,7 @@ async def analyze_document(request: AnalyzeRequest):
             for issue, formatted in zip(prioritized, formatted_issues)
         ]
         
-        return AnalysisResponse(
+        return _model_response(AnalysisResponse(
             success=True,
             score=score,
             is_ready=is_ready,
@@ -285,12 +268,12 @@ async def analyze_document(request: AnalyzeRequest):
             severity_level=guidance_result.get("severity_level", "medium"),
             processing_time_ms=int((time.time() - start_time) * 1000),
             extracted_data=vision_result.get("extracted_data", {}) if vision_result else {}
-        )
+        ))
         
     except HTTPException:
         raise
     except Exception as e:
-        return AnalysisResponse(
+        return _model_response(AnalysisResponse(
             success=False,
             score=0,
             is_ready=False,
@@ -306,10 +289,30 @@ async def analyze_document(request: AnalyzeRequest):
             encouragement="Let's try again!",
             severity_level="high",
             processing_time_ms=int((time.time() - start_time) * 1000)
-        )
+        ))
 
 
-@app.post("/analyze/upload")
+@app.post("/analyze", response_model=AnalysisResponse)
+async def analyze_document(request: AnalyzeRequest):
+    """Analyze a base64-encoded document image and return issues/guidance."""
+    start_time = time.time()
+    
+    try:
+        image_bytes = base64.b64decode(request.image_base64)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid base64 image data")
+    
+    return await _analyze_image(
+        image_bytes,
+        request.document_type,
+        request.country_code,
+        request.side,
+        request.attempt,
+        start_time
+    )
+
+
+@app.post("/analyze/upload", response_model=AnalysisResponse)
 async def analyze_document_upload(
     file: UploadFile = File(...),
     document_type: str = Form(...),
@@ -319,24 +322,20 @@ async def analyze_document_upload(
 ):
     """
     Analyze document from file upload.
-    Alternative to base64 for direct file upload.
+    Alternative to base64 for direct file upload: the raw bytes go
+    straight to image processing without a base64 round-trip.
     """
-    # Read file content
+    start_time = time.time()
     contents = await file.read()
     
-    # Convert to base64
-    image_base64 = base64.b64encode(contents).decode()
-    
-    # Create request
-    request = AnalyzeRequest(
-        image_base64=image_base64,
-        document_type=document_type,
-        country_code=country_code,
-        side=side,
-        attempt=attempt
+    return await _analyze_image(
+        contents,
+        document_type,
+        country_code,
+        side,
+        attempt,
+        start_time
     )
-    
-    return await analyze_document(request)
 
 
 @app.post("/submit", response_model=SubmitResponse)
@@ -364,13 +363,13 @@ async def submit_document(request: SubmitRequest):
             issue_score=request.issue_score
         )
         
-        return SubmitResponse(
+        return _model_response(SubmitResponse(
             success=result["success"],
             document_id=result["document_id"],
             status=result["status"],
             message=result["message"],
             can_proceed=result["can_proceed"]
-        )
+        ))
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -396,15 +395,16 @@ async def get_submission_status(document_id: str):
 
 async def vision_analyze_async(image_base64: str, document_type: str, country_code: str) -> dict:
     """
-    Wrapper for vision analysis (would be async in production).
-    Returns mock result for now to avoid blocking.
+    Wrapper for vision analysis.
+    Runs the blocking Gemini call in the default executor so the event
+    loop keeps serving other requests; returns a mock result on failure.
     """
-    # In production, this would call the actual vision analyzer
-    # For now, return a simulated result to avoid API calls during testing
-    
     try:
         from backend.vision_analyzer import analyze_document
-        result = analyze_document(image_base64, document_type, country_code)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None, analyze_document, image_base64, document_type, country_code
+        )
         return result
     except Exception:
         # Fallback mock result
@@ -423,18 +423,68 @@ async def vision_analyze_async(image_base64: str, document_type: str, country_co
         }
 
 
+def _model_response(model: BaseModel) -> ORJSONResponse:
+    """
+    Serialize an already-built response model directly.
+    
+    Returning a Response skips FastAPI's response_model revalidation and
+    jsonable_encoder pass; the decorator's response_model still documents
+    the schema.
+    """
+    return ORJSONResponse(model.model_dump(mode="json"))
+
+
+@lru_cache(maxsize=1)
+def _health_payload() -> bytes:
+    """Serialized health body. Settings are fixed at startup, so encode it once."""
+    return orjson.dumps(HealthResponse(
+        status="healthy",
+        api_version="1.0.0",
+        gemini_configured=bool(settings.GEMINI_API_KEY)
+    ).model_dump(mode="json"))
+
+
+@lru_cache(maxsize=1)
+def _countries_payload() -> bytes:
+    """Serialized /countries body. The country config is static, so encode it once."""
+    from config.deriv_context import get_supported_countries
+    
+    return orjson.dumps({
+        "success": True,
+        "countries": get_supported_countries()
+    })
+
+
+@lru_cache(maxsize=32)
+def _documents_payload(country_code: str) -> Optional[bytes]:
+    """Serialized /documents/{country_code} body, or None for unsupported countries."""
+    from config.deriv_context import DerivContextResolver
+    
+    documents = DerivContextResolver().get_documents(country_code)
+    if not documents:
+        return None
+    
+    return orjson.dumps({
+        "success": True,
+        "country_code": country_code,
+        "documents": documents
+    })
+
+
+_COUNTRY_NAMES = {
+    "PK": "Pakistan",
+    "IN": "India",
+    "NG": "Nigeria",
+    "KE": "Kenya",
+    "GB": "United Kingdom",
+    "DE": "Germany",
+    "UAE": "United Arab Emirates"
+}
+
+
 def get_country_name(country_code: str) -> str:
     """Get country name from code."""
-    country_names = {
-        "PK": "Pakistan",
-        "IN": "India",
-        "NG": "Nigeria",
-        "KE": "Kenya",
-        "GB": "United Kingdom",
-        "DE": "Germany",
-        "UAE": "United Arab Emirates"
-    }
-    return country_names.get(country_code, country_code)
+    return _COUNTRY_NAMES.get(country_code, country_code)
 
 
 # ============================================================================
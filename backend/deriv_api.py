@@ -13,8 +13,8 @@ Reference: https://api.deriv.com/api-explorer#document_upload
 import json
 import time
 import asyncio
-import hashlib
 import logging
+import secrets
 from typing import Optional
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -285,10 +285,9 @@ def _mock_document_upload_response(
     }
 
 
-def _generate_document_id(document_type: str, side: str) -> str:
-    """Generate a unique document ID."""
-    unique = f"{document_type}_{side}_{time.time()}"
-    return f"DOC_{hashlib.md5(unique.encode()).hexdigest()[:12].upper()}"
+def _generate_document_id() -> str:
+    """Generate a unique document ID (DOC_ + 12 random hex chars)."""
+    return f"DOC_{secrets.token_hex(6).upper()}"
 
 
 # ============================================================================
@@ -331,7 +330,7 @@ class DerivSubmissionManager:
 
         Tries real Deriv WebSocket API first, falls back to mock.
         """
-        doc_id = _generate_document_id(document_type, side)
+        doc_id = _generate_document_id()
 
         # Build Deriv API payload
         payload = DerivUploadPayload(
@@ -530,6 +529,10 @@ class DerivSubmissionManager:
         """Get submission history as dicts."""
         return [r.model_dump() for r in self.submission_history]
 
+    def reset(self):
+        """Clear all tracked submissions."""
+        self.submission_history.clear()
+
     def seed_demo_data(self):
         """Populate dashboard with realistic demo submissions."""
         if self.submission_history:
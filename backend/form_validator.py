@@ -24,6 +24,20 @@ def load_country_config() -> Dict:
         return json.load(f)
 
 
+# Validator patterns, compiled once at import
+_PAN_RE = re.compile(r"^[A-Z]{5}[0-9]{4}[A-Z]$")
+_NI_RE = re.compile(r"^[A-Z]{2}\d{6}[A-D]$")
+_UK_POSTCODE_RE = re.compile(r"^[A-Z]{1,2}\d[A-Z\d]?\s?\d[A-Z]{2}$")
+_PHONE_PK_RE = re.compile(r"^03\d{9}$")
+_PHONE_IN_RE = re.compile(r"^[6-9]\d{9}$")
+_PHONE_GB_RE = re.compile(r"^07\d{9}$")
+
+_INVALID_NI_PREFIXES = frozenset({"BG", "GB", "NK", "KN", "TN", "NT", "ZZ"})
+
+# Fixed-length digit formats are checked with str.isdecimal() instead of a regex
+_STRIP_DASHES = str.maketrans("", "", "-")
+
+
 # ============================================================================
 # ID NUMBER VALIDATORS
 # ============================================================================
@@ -42,11 +56,16 @@ def validate_cnic(cnic: str) -> Tuple[bool, Optional[str]]:
     # Remove any extra spaces
     cnic = cnic.strip()
     
-    # Check format with dashes
-    pattern = r"^\d{5}-\d{7}-\d{1}$"
-    if not re.match(pattern, cnic):
+    # Check format with dashes: 5 digits, dash, 7 digits, dash, 1 digit
+    digits_only = cnic.translate(_STRIP_DASHES)
+    if not (
+        len(cnic) == 15
+        and cnic[5] == "-"
+        and cnic[13] == "-"
+        and len(digits_only) == 13
+        and digits_only.isdecimal()
+    ):
         # Try without dashes
-        digits_only = cnic.replace("-", "")
         if len(digits_only) == 13 and digits_only.isdigit():
             # Valid digits, just wrong format
             return False, "CNIC format should be: 12345-1234567-1"
@@ -113,8 +132,7 @@ def validate_pan(pan: str) -> Tuple[bool, Optional[str]]:
     pan = pan.upper().strip()
     
     # Check format
-    pattern = r"^[A-Z]{5}[0-9]{4}[A-Z]$"
-    if not re.match(pattern, pan):
+    if not _PAN_RE.match(pan):
         return False, "PAN format should be: ABCDE1234F (5 letters, 4 digits, 1 letter)"
     
     # Fourth character indicates holder type
@@ -153,13 +171,11 @@ def validate_ni_number(ni: str) -> Tuple[bool, Optional[str]]:
     ni = ni.replace(" ", "").upper().strip()
     
     # Check format
-    pattern = r"^[A-Z]{2}\d{6}[A-D]$"
-    if not re.match(pattern, ni):
+    if not _NI_RE.match(ni):
         return False, "NI Number format should be: QQ 12 34 56 A"
     
     # Invalid prefixes
-    invalid_prefixes = ["BG", "GB", "NK", "KN", "TN", "NT", "ZZ"]
-    if ni[:2] in invalid_prefixes:
+    if ni[:2] in _INVALID_NI_PREFIXES:
         return False, "Invalid NI Number prefix"
     
     # First letter cannot be D, F, I, Q, U, V
@@ -183,9 +199,7 @@ def validate_uk_postcode(postcode: str) -> Tuple[bool, Optional[str]]:
     
     postcode = postcode.upper().strip()
     
-    # UK postcode regex
-    pattern = r"^[A-Z]{1,2}\d[A-Z\d]?\s?\d[A-Z]{2}$"
-    if not re.match(pattern, postcode):
+    if not _UK_POSTCODE_RE.match(postcode):
         return False, "Enter a valid UK postcode (e.g., SW1A 1AA)"
     
     return True, None
@@ -204,7 +218,7 @@ def validate_pk_postal(postal: str) -> Tuple[bool, Optional[str]]:
     
     postal = postal.strip()
     
-    if not re.match(r"^\d{5}$", postal):
+    if len(postal) != 5 or not postal.isdecimal():
         return False, "Postal code must be 5 digits"
     
     return True, None
@@ -223,7 +237,7 @@ def validate_in_pin(pin: str) -> Tuple[bool, Optional[str]]:
     
     pin = pin.strip()
     
-    if not re.match(r"^\d{6}$", pin):
+    if len(pin) != 6 or not pin.isdecimal():
         return False, "PIN code must be 6 digits"
     
     # First digit cannot be 0
@@ -240,7 +254,7 @@ def validate_phone_pk(phone: str) -> Tuple[bool, Optional[str]]:
     
     phone = phone.strip().replace(" ", "").replace("-", "")
     
-    if not re.match(r"^03\d{9}$", phone):
+    if not _PHONE_PK_RE.match(phone):
         return False, "Mobile must start with 03 and be 11 digits"
     
     return True, None
@@ -253,7 +267,7 @@ def validate_phone_in(phone: str) -> Tuple[bool, Optional[str]]:
     
     phone = phone.strip().replace(" ", "").replace("-", "")
     
-    if not re.match(r"^[6-9]\d{9}$", phone):
+    if not _PHONE_IN_RE.match(phone):
         return False, "Mobile must be 10 digits starting with 6-9"
     
     return True, None
@@ -266,7 +280,7 @@ def validate_phone_gb(phone: str) -> Tuple[bool, Optional[str]]:
     
     phone = phone.strip().replace(" ", "").replace("-", "")
     
-    if not re.match(r"^07\d{9}$", phone):
+    if not _PHONE_GB_RE.match(phone):
         return False, "UK mobile must start with 07 and be 11 digits"
     
     return True, None
@@ -302,27 +316,29 @@ def validate_age(dob: date, min_age: int = 18, max_age: int = 100) -> Tuple[bool
 # COUNTRY-SPECIFIC FORM VALIDATORS
 # ============================================================================
 
+_VALIDATORS_BY_COUNTRY = {
+    "PK": {
+        "cnic": validate_cnic,
+        "postal_code": validate_pk_postal,
+        "phone": validate_phone_pk,
+    },
+    "IN": {
+        "aadhaar": validate_aadhaar,
+        "pan": validate_pan,
+        "pin_code": validate_in_pin,
+        "phone": validate_phone_in,
+    },
+    "GB": {
+        "ni_number": validate_ni_number,
+        "postcode": validate_uk_postcode,
+        "phone": validate_phone_gb,
+    },
+}
+
+
 def get_validator(field_id: str, country_code: str):
     """Get the appropriate validator function for a field."""
-    validators = {
-        # Pakistan
-        ("cnic", "PK"): validate_cnic,
-        ("postal_code", "PK"): validate_pk_postal,
-        ("phone", "PK"): validate_phone_pk,
-        
-        # India
-        ("aadhaar", "IN"): validate_aadhaar,
-        ("pan", "IN"): validate_pan,
-        ("pin_code", "IN"): validate_in_pin,
-        ("phone", "IN"): validate_phone_in,
-        
-        # UK
-        ("ni_number", "GB"): validate_ni_number,
-        ("postcode", "GB"): validate_uk_postcode,
-        ("phone", "GB"): validate_phone_gb,
-    }
-    
-    return validators.get((field_id, country_code))
+    return _VALIDATORS_BY_COUNTRY.get(country_code, {}).get(field_id)
 
 
 def validate_form_data(
@@ -350,6 +366,8 @@ def validate_form_data(
         country_config = config["countries"].get(country_code, {})
         fields = country_config.get("personal_fields", [])
     
+    validators = _VALIDATORS_BY_COUNTRY.get(country_code, {})
+    
     for field in fields:
         field_id = field["id"]
         value = data.get(field_id)
@@ -367,7 +385,7 @@ def validate_form_data(
             continue
         
         # Get custom validator
-        validator = get_validator(field_id, country_code)
+        validator = validators.get(field_id)
         if validator:
             is_valid, error = validator(str(value))
             if not is_valid:
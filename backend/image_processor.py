@@ -6,7 +6,7 @@ Validates, resizes, and assesses image quality before AI analysis.
 import io
 import base64
 from typing import Tuple, Optional
-from PIL import Image, ImageFilter, ImageStat
+from PIL import Image, ImageFilter, ImageOps, ImageStat
 import hashlib
 
 
@@ -19,6 +19,7 @@ MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10MB
 MAX_DIMENSION = 4096  # Maximum width/height
 TARGET_SIZE = 1536  # Target size for AI analysis (higher for better text clarity)
 MIN_DIMENSION = 200  # Minimum acceptable dimension
+UPLOAD_JPEG_QUALITY = 85  # Re-encode quality for images sent to the OCR API
 
 
 class ImageProcessingError(Exception):
@@ -65,22 +66,25 @@ def validate_image_format(file_bytes: bytes, mime_type: Optional[str] = None) ->
 def load_image(file_bytes: bytes) -> Image.Image:
     """Load image from bytes, handling various formats."""
     try:
-        image = Image.open(io.BytesIO(file_bytes))
-        # Convert to RGB if necessary (handles RGBA, P mode, etc.)
-        if image.mode in ('RGBA', 'P', 'LA'):
-            # Create white background for transparency
-            background = Image.new('RGB', image.size, (255, 255, 255))
-            if image.mode == 'P':
-                image = image.convert('RGBA')
-            background.paste(image, mask=image.split()[-1] if 'A' in image.mode else None)
-            image = background
-        elif image.mode != 'RGB':
-            image = image.convert('RGB')
-        return image
+        return _to_rgb(Image.open(io.BytesIO(file_bytes)))
     except Exception as e:
         raise ImageProcessingError(f"Failed to load image: {str(e)}")
 
 
+def _to_rgb(image: Image.Image) -> Image.Image:
+    """Convert to RGB if necessary (handles RGBA, P mode, etc.)."""
+    if image.mode in ('RGBA', 'P', 'LA'):
+        # Create white background for transparency
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        background.paste(image, mask=image.split()[-1] if 'A' in image.mode else None)
+        image = background
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+    return image
+
+
 def resize_for_analysis(image: Image.Image, max_size: int = TARGET_SIZE) -> Image.Image:
     """
     Resize image for AI analysis while maintaining aspect ratio.
@@ -144,6 +148,37 @@ def base64_to_image(base64_string: str) -> Image.Image:
     return load_image(image_bytes)
 
 
+def prepare_for_upload(
+    file_bytes: bytes,
+    max_size: int = TARGET_SIZE,
+    quality: int = UPLOAD_JPEG_QUALITY
+) -> bytes:
+    """
+    Downscale and re-encode an image as JPEG before sending it to the OCR API.
+
+    Phone photos are often several MB; capping the long edge at max_size cuts
+    the upload size several-fold. JPEGs already within max_size are returned
+    unchanged, and bytes that can't be decoded are passed through so the API
+    reports the problem as before.
+    """
+    try:
+        image = Image.open(io.BytesIO(file_bytes))
+        if image.format == 'JPEG' and max(image.size) <= max_size:
+            return file_bytes
+        # Let libjpeg decode at a reduced DCT scale when the photo is much larger
+        image.draft('RGB', (max_size, max_size))
+        # Re-encoding drops EXIF, so apply the orientation to the pixels first
+        # (portrait phone photos would otherwise reach the OCR API sideways)
+        image = _to_rgb(ImageOps.exif_transpose(image))
+    except Exception:
+        return file_bytes
+
+    image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality)
+    return buffer.getvalue()
+
+
 def calculate_md5_checksum(file_bytes: bytes) -> str:
     """Calculate MD5 checksum for file (used by Deriv API)."""
     return hashlib.md5(file_bytes).hexdigest()
@@ -251,12 +286,13 @@ def process_document_image(
     quality['original_size'] = f"{image.size[0]}x{image.size[1]}"
     quality['file_size_kb'] = len(file_bytes) / 1024
     
-    # Step 4: Resize for API
-    resized = resize_for_analysis(image)
-    quality['processed_size'] = f"{resized.size[0]}x{resized.size[1]}"
+    # Step 4: Resize for API in place (thumbnail keeps aspect ratio and
+    # avoids allocating a second full-size image)
+    image.thumbnail((TARGET_SIZE, TARGET_SIZE), Image.Resampling.LANCZOS)
+    quality['processed_size'] = f"{image.size[0]}x{image.size[1]}"
     
     # Step 5: Convert to base64 (PNG preserves text edges better for OCR)
-    base64_image = convert_to_base64(resized, format="PNG")
+    base64_image = convert_to_base64(image, format="PNG")
     
     # Step 6: Calculate checksum (for Deriv API)
     quality['checksum'] = calculate_md5_checksum(file_bytes)
@@ -94,6 +94,20 @@ ISSUE_DEFINITIONS = {
     }
 }
 
+# Sort rank per severity (BLOCKING > WARNING > INFO)
+SEVERITY_ORDER = {
+    IssueSeverity.BLOCKING: 0,
+    IssueSeverity.WARNING: 1,
+    IssueSeverity.INFO: 2
+}
+
+# Score penalty points per severity
+SEVERITY_PENALTIES = {
+    IssueSeverity.BLOCKING: 30,
+    IssueSeverity.WARNING: 10,
+    IssueSeverity.INFO: 2
+}
+
 
 def create_issue(
     issue_type: IssueType,
@@ -423,19 +437,10 @@ def prioritize_issues(issues: List[DetectedIssue]) -> List[DetectedIssue]:
             unique_issues.append(issue)
     
     # Sort by severity (BLOCKING > WARNING > INFO)
-    severity_order = {
-        IssueSeverity.BLOCKING: 0,
-        IssueSeverity.WARNING: 1,
-        IssueSeverity.INFO: 2
-    }
-    
-    sorted_issues = sorted(
-        unique_issues,
-        key=lambda x: severity_order.get(x.severity, 3)
-    )
+    unique_issues.sort(key=lambda x: SEVERITY_ORDER.get(x.severity, 3))
     
     # Limit to top 3 actionable issues to avoid overwhelming user
-    return sorted_issues[:3]
+    return unique_issues[:3]
 
 
 def get_primary_blocking_issue(issues: List[DetectedIssue]) -> Optional[DetectedIssue]:
@@ -493,21 +498,13 @@ def calculate_issue_score(issues: List[DetectedIssue]) -> float:
     if not issues:
         return 100.0
     
-    # Penalty points per issue type
-    penalties = {
-        IssueSeverity.BLOCKING: 30,
-        IssueSeverity.WARNING: 10,
-        IssueSeverity.INFO: 2
-    }
-    
     total_penalty = sum(
-        penalties.get(issue.severity, 0)
+        SEVERITY_PENALTIES.get(issue.severity, 0)
         for issue in issues
     )
     
-    # Cap at 100
-    score = max(0, 100 - total_penalty)
-    return float(score)
+    # Floor at 0
+    return float(max(0, 100 - total_penalty))
 
 
 def is_deriv_ready(issues: List[DetectedIssue]) -> bool:
@@ -520,8 +517,9 @@ def is_deriv_ready(issues: List[DetectedIssue]) -> bool:
     Returns:
         True if no blocking issues
     """
+    # Severity is validated into the enum, so identity comparison is safe
     return not any(
-        issue.severity == IssueSeverity.BLOCKING
+        issue.severity is IssueSeverity.BLOCKING
         for issue in issues
     )
 
@@ -13,20 +13,29 @@ Provides:
 import os
 import json
 import base64
+import hashlib
 import re
+import threading
 import time
-from typing import Dict, List, Optional, Any, Tuple
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Any, Tuple
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
+import orjson
+
 # Load environment variables
 from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(env_path)
 
-# Use new google.genai package (google.generativeai is deprecated)
-from google import genai
+# google.genai (google.generativeai is deprecated) and the image helpers are
+# imported on first use: google.genai alone takes most of a second to import.
 
 
 # Load API keys from environment
@@ -43,9 +52,20 @@ class DocumentQuality(Enum):
     UNREADABLE = "unreadable"
 
 
-@dataclass
+# Gemini's overall_quality label -> enum, and the levels that fail a document
+_QUALITY_BY_LABEL = {quality.value: quality for quality in DocumentQuality}
+_FAILING_QUALITIES = frozenset({DocumentQuality.UNREADABLE, DocumentQuality.POOR})
+
+# Keywords the non-JSON fallback parser looks for ("blur" also covers "blurry").
+# The lookahead reports every occurrence, including overlapping ones.
+_UNSTRUCTURED_KEYWORDS_RE = re.compile(
+    r"(?=(unreadable|cannot read|blur|dark|lighting|good|clear|corner))"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class OCRResult:
-    """Result from OCR analysis."""
+    """Result from OCR analysis. Immutable; use dataclasses.replace to adjust."""
     success: bool
     document_type: str
     quality: DocumentQuality
@@ -60,14 +80,308 @@ class OCRResult:
 # Load country forms for OCR prompts
 CONFIG_PATH = Path(__file__).parent.parent / "config" / "country_forms.json"
 
-def load_ocr_prompts() -> Dict[str, str]:
-    """Load OCR prompts from config."""
+@lru_cache(maxsize=1)
+def load_ocr_prompts() -> Mapping[str, str]:
+    """Load OCR prompts from config (read once, returned read-only)."""
     try:
         with open(CONFIG_PATH, "r", encoding="utf-8") as f:
             config = json.load(f)
-            return config.get("ocr_prompts", {})
+            return MappingProxyType(config.get("ocr_prompts", {}))
     except Exception:
-        return {}
+        return MappingProxyType({})
+
+
+@lru_cache(maxsize=128)
+def _compile_field_pattern(pattern: str) -> re.Pattern:
+    """Compile a field validation pattern once and reuse it."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+# Side-aware field mappings: {country: {side: {ocr_field: form_field}}}
+_FIELD_MAPPINGS_BY_SIDE = {
+    "PK": {
+        "front": {
+            "cnic_number": "cnic",
+            "name": "full_name",
+            "name_english": "full_name",
+            "date_of_birth": "date_of_birth",
+        },
+        "back": {
+            # CNIC back has address, NOT the cardholder's name
+            "address": "address_line1",
+            "current_address": "address_line1",
+            "permanent_address": "address_line1",
+        },
+    },
+    "IN": {
+        "front": {
+            "aadhaar_number": "aadhaar",
+            "name": "full_name",
+            "date_of_birth": "date_of_birth",
+        },
+        "back": {
+            "address": "address_line1",
+        },
+    },
+    "GB": {
+        "front": {
+            "surname": "last_name",
+            "given_names": "first_name",
+            "date_of_birth": "date_of_birth",
+        },
+        "photo_page": {
+            "surname": "last_name",
+            "given_names": "first_name",
+            "date_of_birth": "date_of_birth",
+        },
+    },
+    "AE": {
+        "front": {
+            "name": "full_name",
+            "name_english": "full_name",
+            "emirates_id_number": "emirates_id",
+        },
+        "back": {
+            "date_of_birth": "date_of_birth",
+            "gender": "gender",
+        },
+    },
+}
+
+# Address statuses where the document address is expected to differ from the form
+_ADDRESS_MOVED_STATUSES = frozenset({
+    "Moved from document address",
+    "Renting a different address",
+})
+
+# Separators ignored when comparing document and form values
+_STRIP_SEPARATORS = str.maketrans("", "", "- ")
+
+
+def _normalize_text(value: Any) -> str:
+    """Casefold and drop dashes/spaces so formatting differences don't count."""
+    return _normalize_str(str(value))
+
+
+@lru_cache(maxsize=1024)
+def _normalize_str(text: str) -> str:
+    # NFKC folds full-width digits and other compatibility forms some OCR
+    # output and phone keyboards produce. Cached: Streamlit reruns compare
+    # the same document and form values again and again.
+    return unicodedata.normalize("NFKC", text).casefold().strip().translate(_STRIP_SEPARATORS)
+
+
+# Side-aware document requirements used to build OCR prompts
+_DOC_REQUIREMENTS = {
+    "cnic": {
+        "name": "Pakistani CNIC (Computerized National Identity Card)",
+        "front": {
+            "required_elements": "13-digit CNIC number, name in Urdu and English, father's name, date of birth, photo, gender",
+            "extract_fields": "cnic_number, name_english, name_urdu, father_name, date_of_birth, gender"
+        },
+        "back": {
+            "required_elements": "Permanent address, current address, issue date, expiry date. NOTE: The name on the back is NOT the cardholder's name",
+            "extract_fields": "permanent_address, current_address, address, issue_date, expiry_date"
+        }
+    },
+    "aadhaar": {
+        "name": "Indian Aadhaar Card",
+        "front": {
+            "required_elements": "12-digit Aadhaar number, name, date of birth, gender, photo, QR code",
+            "extract_fields": "aadhaar_number, name, date_of_birth, gender"
+        },
+        "back": {
+            "required_elements": "Full address, QR code, VID number",
+            "extract_fields": "address, vid_number"
+        }
+    },
+    "passport": {
+        "name": "Passport",
+        "front": {
+            "required_elements": "Passport number, surname, given names, date of birth, expiry date, photo, MRZ zone",
+            "extract_fields": "passport_number, surname, given_names, date_of_birth, expiry_date, nationality"
+        },
+        "photo_page": {
+            "required_elements": "Passport number, surname, given names, date of birth, expiry date, photo, MRZ zone",
+            "extract_fields": "passport_number, surname, given_names, date_of_birth, expiry_date, nationality"
+        }
+    },
+    "driving_license": {
+        "name": "Driving License",
+        "front": {
+            "required_elements": "License number, name, date of birth, photo, expiry date",
+            "extract_fields": "license_number, name, date_of_birth, expiry_date"
+        },
+        "back": {
+            "required_elements": "Address, vehicle categories, additional information",
+            "extract_fields": "address, categories"
+        }
+    },
+    "utility_bill": {
+        "name": "Utility Bill / Bank Statement",
+        "front": {
+            "required_elements": "Account holder name, full address, bill/issue/due date within last 3 months, company name/logo",
+            "extract_fields": "account_holder_name, address, bill_date, issue_date, due_date, statement_date, company_name"
+        }
+    },
+    "emirates_id": {
+        "name": "UAE Emirates ID",
+        "front": {
+            "required_elements": "Emirates ID number, name in English and Arabic, nationality, photo",
+            "extract_fields": "emirates_id_number, name_english, name_arabic, nationality"
+        },
+        "back": {
+            "required_elements": "Date of birth, gender, card number, expiry date",
+            "extract_fields": "date_of_birth, gender, card_number, expiry_date"
+        }
+    }
+}
+
+
+@lru_cache(maxsize=64)
+def _render_ocr_prompt(document_type: str, country_code: str, side: str, custom_prompt: str) -> str:
+    """
+    Render the OCR prompt for one (document, country, side) combination.
+    
+    The combination space is small and the prompt is pure text, so each
+    one is rendered once and reused.
+    """
+    doc_info_raw = _DOC_REQUIREMENTS.get(document_type, {
+        "name": document_type.upper(),
+        "front": {
+            "required_elements": "standard ID document elements",
+            "extract_fields": "name, id_number, date_of_birth"
+        }
+    })
+
+    # Look up side-specific info, fallback to front
+    doc_name = doc_info_raw.get("name", document_type.upper())
+    side_info = doc_info_raw.get(side, doc_info_raw.get("front", {}))
+    doc_info = {
+        "name": doc_name,
+        "required_elements": side_info.get("required_elements", "standard ID document elements"),
+        "extract_fields": side_info.get("extract_fields", "name, id_number, date_of_birth")
+    }
+    
+    base_prompt = f"""
+You are a STRICT document verification expert. Your job is to analyze images and determine if they are valid identity documents.
+
+CRITICAL TASK: Analyze this image and determine if it is a valid {doc_info['name']} ({side} side) from {country_code}.
+
+STEP 1 - DOCUMENT TYPE VERIFICATION:
+First, determine if this image shows a REAL {doc_info['name']}.
+- Is this actually an official identity document?
+- Is this the correct document type ({document_type})?
+- A photo of a person, selfie, random object, or non-document image should be marked as document_detected: false
+
+STEP 2 - If it IS a valid document, assess quality:
+- Is the image clear and readable?
+- Are all corners visible?
+- Is there blur, glare, or shadows?
+- Can you read the text clearly?
+
+STEP 3 - If valid, extract these fields: {doc_info['extract_fields']}
+
+Required elements for a valid {doc_info['name']}: {doc_info['required_elements']}
+
+RESPOND WITH ONLY THIS JSON (no other text):
+
+{{
+    "document_detected": true/false,
+    "is_valid_document_type": true/false,
+    "rejection_reason": "reason if document_detected is false, else null",
+    "document_type_detected": "what type of document this actually is, or 'NOT_A_DOCUMENT' if not a document",
+    "has_required_photo": true/false,
+    "has_required_elements": true/false,
+    
+    "quality_assessment": {{
+        "overall_quality": "excellent/good/acceptable/poor/unreadable",
+        "quality_score": 0-100,
+        "is_blurry": true/false,
+        "is_too_dark": true/false,
+        "is_too_bright": true/false,
+        "has_glare": true/false,
+        "all_corners_visible": true/false,
+        "is_rotated": true/false,
+        "text_readable": true/false
+    }},
+    
+    "extracted_fields": {{
+        // Only populate if document_detected is true
+        // Extract: {doc_info['extract_fields']}
+        // Set to null if not readable
+    }},
+    
+    "issues": [
+        {{
+            "type": "ISSUE_TYPE",
+            "severity": "blocking/warning/info",
+            "message": "Description",
+            "suggestion": "How to fix"
+        }}
+    ],
+    
+    "verification_status": "verified/needs_review/rejected",
+    "confidence_score": 0-100
+}}
+
+STRICT RULES:
+1. If the image is NOT a {doc_info['name']}, set document_detected: false and quality_score: 0
+2. A photo of a baby, person, selfie, or random image is NOT a document - reject it
+3. If you cannot clearly identify this as a {doc_info['name']}, set is_valid_document_type: false
+4. For ID documents (cnic, aadhaar, passport), has_required_photo must check for an ID photo on the document
+5. Be STRICT - when in doubt, mark as poor quality or reject
+6. Return ONLY valid JSON, no markdown code blocks
+
+{custom_prompt}
+"""
+    return base_prompt
+
+
+# Form fields compared with a small edit-distance allowance (OCR/transliteration slips)
+_NAME_FIELDS = frozenset({"full_name", "first_name", "last_name"})
+
+
+def _levenshtein_within(a: str, b: str, max_edits: int) -> bool:
+    """
+    True if the edit distance between a and b is at most max_edits.
+    
+    Banded two-row DP: only cells within max_edits of the diagonal can
+    stay under the bound, so each row costs O(max_edits) instead of
+    O(len(b)). Bails out as soon as the length gap or a whole band
+    exceeds the bound.
+    """
+    if abs(len(a) - len(b)) > max_edits:
+        return False
+    if len(a) < len(b):
+        a, b = b, a
+    
+    over = max_edits + 1  # Stand-in for "anything above the bound"
+    width = len(b)
+    previous = [j if j <= max_edits else over for j in range(width + 1)]
+    for i, char_a in enumerate(a, 1):
+        low = max(1, i - max_edits)
+        high = min(width, i + max_edits)
+        current = [over] * (width + 1)
+        current[0] = i if i <= max_edits else over
+        for j in range(low, high + 1):
+            current[j] = min(
+                previous[j] + 1,                            # deletion
+                current[j - 1] + 1,                         # insertion
+                previous[j - 1] + (char_a != b[j - 1]),     # substitution
+                over,
+            )
+        if min(current[low - 1:high + 1]) > max_edits:
+            return False
+        previous = current
+    
+    return previous[width] <= max_edits
+
+
+def _names_match(ocr_normalized: str, form_normalized: str) -> bool:
+    """Allow one edit per five characters (max 2), e.g. 'Ahmad' vs 'Ahmed'."""
+    max_edits = min(2, min(len(ocr_normalized), len(form_normalized)) // 5)
+    return _levenshtein_within(ocr_normalized, form_normalized, max_edits)
 
 
 class GeminiOCR:
@@ -90,14 +404,12 @@ class GeminiOCR:
         self.model_name = "gemini-2.5-flash"  # Primary model (has separate quota)
         self.ocr_prompts = load_ocr_prompts()
         
-        # Create Gemini client
+        # Gemini client, created on first API call (see _get_client)
         self._client = None
-        if self.api_key:
-            self._client = genai.Client(api_key=self.api_key)
+        self._client_lock = threading.Lock()
         
         self._call_count = 0
-        self._last_error = None
-        self._used_provider = None  # Track which provider was used
+        self._call_count_lock = threading.Lock()  # Batch analysis calls from worker threads
     
     @property
     def call_count(self) -> int:
@@ -106,17 +418,41 @@ class GeminiOCR:
     
     def is_configured(self) -> bool:
         """Check if Gemini API is configured."""
-        return bool(self.api_key) and self._client is not None
+        return bool(self.api_key)
+    
+    def _get_client(self):
+        """Create the Gemini client on first use."""
+        if self._client is None and self.api_key:
+            with self._client_lock:
+                if self._client is None:
+                    from google import genai
+                    self._client = genai.Client(api_key=self.api_key)
+        return self._client
     
     # Note: Groq vision models have been decommissioned (Jan 2026)
     # Using Gemini only for vision tasks
     
-    def _call_with_retry(self, prompt: str, image_bytes: bytes, max_retries: int = 2) -> Optional[str]:
-        """Call Gemini API with retry logic."""
+    def _call_with_retry(
+        self,
+        prompt: str,
+        image_bytes: bytes,
+        max_retries: int = 2
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Call Gemini API with retry logic.
+        
+        Returns:
+            Tuple of (response_text, last_error). The error is returned rather
+            than stored on the instance because batch analysis calls this from
+            several threads at once.
+        """
         
-        if not self._client:
+        client = self._get_client()
+        if not client:
             print("[GEMINI OCR] No client configured")
-            return None
+            return None, None
+        from google.genai import types
+        last_error = None
         
         # Try Gemini models in order
         for model_name in self.GEMINI_MODELS:
@@ -125,22 +461,22 @@ class GeminiOCR:
                     print(f"[GEMINI OCR] Trying model: {model_name} (attempt {attempt + 1})")
                     
                     # Use new google.genai API
-                    response = self._client.models.generate_content(
+                    response = client.models.generate_content(
                         model=model_name,
                         contents=[
-                            genai.types.Part(text=prompt),
-                            genai.types.Part(inline_data=genai.types.Blob(data=image_bytes, mime_type="image/jpeg"))
+                            types.Part(text=prompt),
+                            types.Part(inline_data=types.Blob(data=image_bytes, mime_type="image/jpeg"))
                         ]
                     )
                     
-                    self._call_count += 1
-                    self._used_provider = "gemini"
+                    with self._call_count_lock:
+                        self._call_count += 1
                     print(f"[GEMINI OCR] Success with {model_name}!")
-                    return response.text
+                    return response.text, None
                     
                 except Exception as e:
                     error_str = str(e)
-                    self._last_error = error_str
+                    last_error = error_str
                     
                     # Check if it's a rate limit error
                     if "429" in error_str or "quota" in error_str.lower():
@@ -169,7 +505,7 @@ class GeminiOCR:
                         continue
         
         print("[GEMINI OCR] All models failed")
-        return None
+        return None, last_error
     
     def analyze_document(
         self,
@@ -210,17 +546,32 @@ class GeminiOCR:
                 error_message="No API key configured"
             )
         
+        # Re-uploads of the same photo (retries, going back a step) reuse the
+        # earlier analysis instead of spending another API call
+        cache_key = (
+            hashlib.blake2b(image_bytes, digest_size=16).digest(),
+            document_type, country_code, side
+        )
+        cached = _get_cached_result(cache_key)
+        if cached is not None:
+            print(f"[GEMINI OCR] Using cached result for identical image")
+            return cached
+        
         try:
             # Build prompt
             prompt = self._build_prompt(document_type, country_code, side)
             
+            # Downscale/re-encode large photos so less data goes over the wire
+            from backend.image_processor import prepare_for_upload
+            upload_bytes = prepare_for_upload(image_bytes)
+
             # Call API with retry logic (using new google.genai with raw bytes)
             print(f"[OCR] >>> CALLING GEMINI API <<<")
-            response_text = self._call_with_retry(prompt, image_bytes)
+            response_text, last_error = self._call_with_retry(prompt, upload_bytes)
             
             if response_text is None:
                 # All models failed
-                error_msg = self._last_error or "All API models failed"
+                error_msg = last_error or "All API models failed"
                 
                 # Check if it's a quota error
                 if "quota" in error_msg.lower() or "429" in error_msg:
@@ -260,6 +611,7 @@ class GeminiOCR:
             print(f"[GEMINI OCR] Parsed result - Success: {result.success}, Score: {result.quality_score}")
             print(f"{'='*60}\n")
             
+            _cache_result(cache_key, result)
             return result
             
         except Exception as e:
@@ -277,168 +629,37 @@ class GeminiOCR:
                 error_message=str(e)
             )
     
-    def _build_prompt(self, document_type: str, country_code: str, side: str) -> str:
-        """Build the OCR prompt for Gemini."""
+    def analyze_documents_batch(
+        self,
+        items: List[Tuple[bytes, str, str, str]],
+        max_concurrency: int = 8
+    ) -> List[OCRResult]:
+        """
+        Analyze several documents concurrently.
         
-        # Get custom prompt if available
-        custom_prompt = self.ocr_prompts.get(document_type, "")
+        Each Gemini call is a blocking network round-trip, so running them
+        on a small thread pool overlaps the latency: a batch takes about as
+        long as its slowest call instead of the sum of all calls. All calls
+        share this instance's client and its connection pool.
         
-        # Side-aware document requirements
-        doc_requirements = {
-            "cnic": {
-                "name": "Pakistani CNIC (Computerized National Identity Card)",
-                "front": {
-                    "required_elements": "13-digit CNIC number, name in Urdu and English, father's name, date of birth, photo, gender",
-                    "extract_fields": "cnic_number, name_english, name_urdu, father_name, date_of_birth, gender"
-                },
-                "back": {
-                    "required_elements": "Permanent address, current address, issue date, expiry date. NOTE: The name on the back is NOT the cardholder's name",
-                    "extract_fields": "permanent_address, current_address, address, issue_date, expiry_date"
-                }
-            },
-            "aadhaar": {
-                "name": "Indian Aadhaar Card",
-                "front": {
-                    "required_elements": "12-digit Aadhaar number, name, date of birth, gender, photo, QR code",
-                    "extract_fields": "aadhaar_number, name, date_of_birth, gender"
-                },
-                "back": {
-                    "required_elements": "Full address, QR code, VID number",
-                    "extract_fields": "address, vid_number"
-                }
-            },
-            "passport": {
-                "name": "Passport",
-                "front": {
-                    "required_elements": "Passport number, surname, given names, date of birth, expiry date, photo, MRZ zone",
-                    "extract_fields": "passport_number, surname, given_names, date_of_birth, expiry_date, nationality"
-                },
-                "photo_page": {
-                    "required_elements": "Passport number, surname, given names, date of birth, expiry date, photo, MRZ zone",
-                    "extract_fields": "passport_number, surname, given_names, date_of_birth, expiry_date, nationality"
-                }
-            },
-            "driving_license": {
-                "name": "Driving License",
-                "front": {
-                    "required_elements": "License number, name, date of birth, photo, expiry date",
-                    "extract_fields": "license_number, name, date_of_birth, expiry_date"
-                },
-                "back": {
-                    "required_elements": "Address, vehicle categories, additional information",
-                    "extract_fields": "address, categories"
-                }
-            },
-            "utility_bill": {
-                "name": "Utility Bill / Bank Statement",
-                "front": {
-                    "required_elements": "Account holder name, full address, bill/issue/due date within last 3 months, company name/logo",
-                    "extract_fields": "account_holder_name, address, bill_date, issue_date, due_date, statement_date, company_name"
-                }
-            },
-            "emirates_id": {
-                "name": "UAE Emirates ID",
-                "front": {
-                    "required_elements": "Emirates ID number, name in English and Arabic, nationality, photo",
-                    "extract_fields": "emirates_id_number, name_english, name_arabic, nationality"
-                },
-                "back": {
-                    "required_elements": "Date of birth, gender, card number, expiry date",
-                    "extract_fields": "date_of_birth, gender, card_number, expiry_date"
-                }
-            }
-        }
-
-        doc_info_raw = doc_requirements.get(document_type, {
-            "name": document_type.upper(),
-            "front": {
-                "required_elements": "standard ID document elements",
-                "extract_fields": "name, id_number, date_of_birth"
-            }
-        })
-
-        # Look up side-specific info, fallback to front
-        doc_name = doc_info_raw.get("name", document_type.upper())
-        side_info = doc_info_raw.get(side, doc_info_raw.get("front", {}))
-        doc_info = {
-            "name": doc_name,
-            "required_elements": side_info.get("required_elements", "standard ID document elements"),
-            "extract_fields": side_info.get("extract_fields", "name, id_number, date_of_birth")
-        }
+        Args:
+            items: (image_bytes, document_type, country_code, side) tuples
+            max_concurrency: Upper bound on in-flight API calls
         
-        base_prompt = f"""
-You are a STRICT document verification expert. Your job is to analyze images and determine if they are valid identity documents.
-
-CRITICAL TASK: Analyze this image and determine if it is a valid {doc_info['name']} ({side} side) from {country_code}.
-
-STEP 1 - DOCUMENT TYPE VERIFICATION:
-First, determine if this image shows a REAL {doc_info['name']}.
-- Is this actually an official identity document?
-- Is this the correct document type ({document_type})?
-- A photo of a person, selfie, random object, or non-document image should be marked as document_detected: false
-
-STEP 2 - If it IS a valid document, assess quality:
-- Is the image clear and readable?
-- Are all corners visible?
-- Is there blur, glare, or shadows?
-- Can you read the text clearly?
-
-STEP 3 - If valid, extract these fields: {doc_info['extract_fields']}
-
-Required elements for a valid {doc_info['name']}: {doc_info['required_elements']}
-
-RESPOND WITH ONLY THIS JSON (no other text):
-
-{{
-    "document_detected": true/false,
-    "is_valid_document_type": true/false,
-    "rejection_reason": "reason if document_detected is false, else null",
-    "document_type_detected": "what type of document this actually is, or 'NOT_A_DOCUMENT' if not a document",
-    "has_required_photo": true/false,
-    "has_required_elements": true/false,
-    
-    "quality_assessment": {{
-        "overall_quality": "excellent/good/acceptable/poor/unreadable",
-        "quality_score": 0-100,
-        "is_blurry": true/false,
-        "is_too_dark": true/false,
-        "is_too_bright": true/false,
-        "has_glare": true/false,
-        "all_corners_visible": true/false,
-        "is_rotated": true/false,
-        "text_readable": true/false
-    }},
-    
-    "extracted_fields": {{
-        // Only populate if document_detected is true
-        // Extract: {doc_info['extract_fields']}
-        // Set to null if not readable
-    }},
-    
-    "issues": [
-        {{
-            "type": "ISSUE_TYPE",
-            "severity": "blocking/warning/info",
-            "message": "Description",
-            "suggestion": "How to fix"
-        }}
-    ],
+        Returns:
+            OCRResults in the same order as items
+        """
+        if not items:
+            return []
+        
+        workers = max(1, min(max_concurrency, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.analyze_document(*item), items))
     
-    "verification_status": "verified/needs_review/rejected",
-    "confidence_score": 0-100
-}}
-
-STRICT RULES:
-1. If the image is NOT a {doc_info['name']}, set document_detected: false and quality_score: 0
-2. A photo of a baby, person, selfie, or random image is NOT a document - reject it
-3. If you cannot clearly identify this as a {doc_info['name']}, set is_valid_document_type: false
-4. For ID documents (cnic, aadhaar, passport), has_required_photo must check for an ID photo on the document
-5. Be STRICT - when in doubt, mark as poor quality or reject
-6. Return ONLY valid JSON, no markdown code blocks
-
-{custom_prompt}
-"""
-        return base_prompt
+    def _build_prompt(self, document_type: str, country_code: str, side: str) -> str:
+        """Build the OCR prompt for Gemini."""
+        custom_prompt = self.ocr_prompts.get(document_type, "")
+        return _render_ocr_prompt(document_type, country_code, side, custom_prompt)
     
     def _parse_response(self, response_text: str, document_type: str) -> OCRResult:
         """Parse Gemini response into OCRResult."""
@@ -446,22 +667,16 @@ STRICT RULES:
         print(f"[GEMINI OCR] Parsing response...")
         
         try:
-            # Clean up response - remove markdown code blocks if present
-            cleaned = response_text.strip()
-            if cleaned.startswith("```"):
-                # Remove code block markers
-                lines = cleaned.split("\n")
-                lines = [l for l in lines if not l.strip().startswith("```")]
-                cleaned = "\n".join(lines)
-            
-            # Also try to find JSON within the response
-            if "{" in cleaned:
-                start = cleaned.find("{")
-                end = cleaned.rfind("}") + 1
-                cleaned = cleaned[start:end]
+            # Take the outermost JSON object; this also drops any markdown
+            # code fence or prose around it without copying the text twice
+            start = response_text.find("{")
+            if start != -1:
+                cleaned = response_text[start:response_text.rfind("}") + 1]
+            else:
+                cleaned = response_text.strip()
             
             # Parse JSON
-            data = json.loads(cleaned)
+            data = orjson.loads(cleaned)
             
             # Check if document was detected
             document_detected = data.get("document_detected", False)
@@ -500,14 +715,7 @@ STRICT RULES:
             quality_score = quality_data.get("quality_score", 50)
             
             # Map to enum
-            quality_map = {
-                "excellent": DocumentQuality.EXCELLENT,
-                "good": DocumentQuality.GOOD,
-                "acceptable": DocumentQuality.ACCEPTABLE,
-                "poor": DocumentQuality.POOR,
-                "unreadable": DocumentQuality.UNREADABLE
-            }
-            quality = quality_map.get(quality_str.lower(), DocumentQuality.POOR)
+            quality = _QUALITY_BY_LABEL.get(quality_str.lower(), DocumentQuality.POOR)
             
             # Extract issues
             issues = data.get("issues", [])
@@ -556,7 +764,7 @@ STRICT RULES:
                 raw_response=response_text
             )
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             print(f"[GEMINI OCR] JSON parse error: {e}")
             # Try to extract key info from unstructured response
             return self._parse_unstructured_response(response_text, document_type)
@@ -564,19 +772,19 @@ STRICT RULES:
     def _parse_unstructured_response(self, response_text: str, document_type: str) -> OCRResult:
         """Fallback parser for non-JSON responses."""
         
-        # Try to detect quality keywords
-        text_lower = response_text.lower()
+        # Detect quality keywords in one scan of the text
+        found = set(_UNSTRUCTURED_KEYWORDS_RE.findall(response_text.lower()))
         
-        if "unreadable" in text_lower or "cannot read" in text_lower:
+        if "unreadable" in found or "cannot read" in found:
             quality = DocumentQuality.UNREADABLE
             score = 10
-        elif "blurry" in text_lower or "blur" in text_lower:
+        elif "blur" in found:
             quality = DocumentQuality.POOR
             score = 30
-        elif "dark" in text_lower or "lighting" in text_lower:
+        elif "dark" in found or "lighting" in found:
             quality = DocumentQuality.POOR
             score = 35
-        elif "good" in text_lower or "clear" in text_lower:
+        elif "good" in found or "clear" in found:
             quality = DocumentQuality.GOOD
             score = 75
         else:
@@ -587,20 +795,20 @@ STRICT RULES:
         issues = []
         suggestions = []
         
-        if "blur" in text_lower:
+        if "blur" in found:
             issues.append({"type": "BLURRY", "severity": "blocking", "message": "Document is blurry"})
             suggestions.append("Hold camera steady and tap to focus")
         
-        if "dark" in text_lower:
+        if "dark" in found:
             issues.append({"type": "TOO_DARK", "severity": "warning", "message": "Image is too dark"})
             suggestions.append("Move to a well-lit area")
         
-        if "corner" in text_lower:
+        if "corner" in found:
             issues.append({"type": "CORNERS_CUT", "severity": "blocking", "message": "Corners not visible"})
             suggestions.append("Ensure all 4 corners are visible")
         
         return OCRResult(
-            success=quality not in [DocumentQuality.UNREADABLE, DocumentQuality.POOR],
+            success=quality not in _FAILING_QUALITIES,
             document_type=document_type,
             quality=quality,
             quality_score=score,
@@ -634,7 +842,7 @@ STRICT RULES:
         
         # Validate against pattern if provided
         if expected_pattern:
-            if re.match(expected_pattern, value_str, re.IGNORECASE):
+            if _compile_field_pattern(expected_pattern).match(value_str):
                 return value_str, True
             else:
                 return value_str, False
@@ -658,92 +866,140 @@ STRICT RULES:
         """
         mismatches = []
 
-        def normalize_text(value: Any) -> str:
-            return str(value).casefold().strip().replace("-", "").replace(" ", "")
-
-        # Side-aware field mappings: {country: {side: {ocr_field: form_field}}}
-        field_mappings_by_side = {
-            "PK": {
-                "front": {
-                    "cnic_number": "cnic",
-                    "name": "full_name",
-                    "name_english": "full_name",
-                    "date_of_birth": "date_of_birth",
-                },
-                "back": {
-                    # CNIC back has address, NOT the cardholder's name
-                    "address": "address_line1",
-                    "current_address": "address_line1",
-                    "permanent_address": "address_line1",
-                },
-            },
-            "IN": {
-                "front": {
-                    "aadhaar_number": "aadhaar",
-                    "name": "full_name",
-                    "date_of_birth": "date_of_birth",
-                },
-                "back": {
-                    "address": "address_line1",
-                },
-            },
-            "GB": {
-                "front": {
-                    "surname": "last_name",
-                    "given_names": "first_name",
-                    "date_of_birth": "date_of_birth",
-                },
-                "photo_page": {
-                    "surname": "last_name",
-                    "given_names": "first_name",
-                    "date_of_birth": "date_of_birth",
-                },
-            },
-            "AE": {
-                "front": {
-                    "name": "full_name",
-                    "name_english": "full_name",
-                    "emirates_id_number": "emirates_id",
-                },
-                "back": {
-                    "date_of_birth": "date_of_birth",
-                    "gender": "gender",
-                },
-            },
-        }
-
         # Look up side-specific mappings, fallback to front
-        country_sides = field_mappings_by_side.get(country_code, {})
-        mappings = country_sides.get(side, country_sides.get("front", {}))
+        mappings = _side_mappings(country_code, side)
 
         # Check if user indicated renting/moved — skip address comparison
-        address_status = str(form_data.get("address_status", "") or "")
-        skip_address = address_status in (
-            "Moved from document address",
-            "Renting a different address",
-        )
+        skip_address = _skips_address(form_data)
 
         for ocr_field, form_field in mappings.items():
             # Skip address fields if user is renting/moved
             if skip_address and form_field == "address_line1":
                 continue
 
-            ocr_value = extracted_fields.get(ocr_field)
-            form_value = form_data.get(form_field)
+            mismatch = _field_mismatch(
+                form_field, extracted_fields.get(ocr_field), form_data.get(form_field)
+            )
+            if mismatch:
+                mismatches.append(mismatch)
 
-            if ocr_value and form_value:
-                ocr_normalized = normalize_text(ocr_value)
-                form_normalized = normalize_text(form_value)
+        return len(mismatches) == 0, mismatches
 
-                if ocr_normalized != form_normalized:
-                    mismatches.append({
-                        "field": form_field,
-                        "form_value": str(form_value),
-                        "document_value": str(ocr_value),
-                        "message": f"{form_field} on document doesn't match form"
-                    })
+    def compare_batch_with_forms(
+        self,
+        results: List[OCRResult],
+        forms: List[Dict[str, Any]],
+        country_code: str,
+        side: str = "front",
+    ) -> List[Tuple[bool, List[Dict[str, str]]]]:
+        """
+        Compare many OCR results against their forms, one field column at a time.
+        Same per-item output as compare_with_form, in input order.
+        """
+        if len(results) != len(forms):
+            raise ValueError("results and forms must have the same length")
 
-        return len(mismatches) == 0, mismatches
+        mappings = _side_mappings(country_code, side)
+        ocr_columns = results_to_columns(results, mappings.keys())
+        skip_address = [_skips_address(form) for form in forms]
+        per_item: List[List[Dict[str, str]]] = [[] for _ in results]
+
+        for ocr_field, form_field in mappings.items():
+            is_address = form_field == "address_line1"
+            form_column = [form.get(form_field) for form in forms]
+            for i, (ocr_value, form_value) in enumerate(zip(ocr_columns[ocr_field], form_column)):
+                if is_address and skip_address[i]:
+                    continue
+                mismatch = _field_mismatch(form_field, ocr_value, form_value)
+                if mismatch:
+                    per_item[i].append(mismatch)
+
+        return [(len(mismatches) == 0, mismatches) for mismatches in per_item]
+
+
+# Parsed results keyed by (image content hash, document type, country, side).
+# Module-level so every GeminiOCR instance shares it: the app builds a new
+# instance per upload.
+RESULT_CACHE_SIZE = 64
+_RESULT_CACHE: "OrderedDict[Tuple[bytes, str, str, str], OCRResult]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _get_cached_result(key: Tuple[bytes, str, str, str]) -> Optional[OCRResult]:
+    """Copy of a cached result, or None. Copied because callers add issues to it."""
+    with _RESULT_CACHE_LOCK:
+        result = _RESULT_CACHE.get(key)
+        if result is None:
+            return None
+        _RESULT_CACHE.move_to_end(key)
+    return _copy_result(result)
+
+
+def _cache_result(key: Tuple[bytes, str, str, str], result: OCRResult) -> None:
+    """Remember a parsed result, evicting the least recently used past RESULT_CACHE_SIZE."""
+    with _RESULT_CACHE_LOCK:
+        _RESULT_CACHE[key] = _copy_result(result)
+        _RESULT_CACHE.move_to_end(key)
+        if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+
+
+def _copy_result(result: OCRResult) -> OCRResult:
+    """Copy of an OCRResult whose field dict and issue/suggestion lists are not shared."""
+    return replace(
+        result,
+        extracted_fields=dict(result.extracted_fields),
+        issues=[dict(issue) for issue in result.issues],
+        suggestions=list(result.suggestions),
+    )
+
+
+def _side_mappings(country_code: str, side: str) -> Dict[str, str]:
+    """OCR-field -> form-field mapping for a country/side, falling back to front."""
+    country_sides = _FIELD_MAPPINGS_BY_SIDE.get(country_code, {})
+    return country_sides.get(side, country_sides.get("front", {}))
+
+
+def _skips_address(form_data: Dict[str, Any]) -> bool:
+    """True if the user indicated they rent or moved, so addresses aren't compared."""
+    return str(form_data.get("address_status", "") or "") in _ADDRESS_MOVED_STATUSES
+
+
+def _field_mismatch(form_field: str, ocr_value: Any, form_value: Any) -> Optional[Dict[str, str]]:
+    """Mismatch entry for one field, or None if the values agree (or one is missing)."""
+    if not (ocr_value and form_value):
+        return None
+
+    ocr_normalized = _normalize_text(ocr_value)
+    form_normalized = _normalize_text(form_value)
+
+    if ocr_normalized == form_normalized:
+        return None
+    if form_field in _NAME_FIELDS and _names_match(ocr_normalized, form_normalized):
+        return None
+
+    return {
+        "field": form_field,
+        "form_value": str(form_value),
+        "document_value": str(ocr_value),
+        "message": f"{form_field} on document doesn't match form"
+    }
+
+
+def results_to_columns(
+    results: List[OCRResult],
+    fields: Optional[Iterable[str]] = None
+) -> Dict[str, List[Any]]:
+    """
+    Turn a batch of OCR results into one list per extracted field.
+
+    Missing fields are None. If fields is omitted, every field seen in the
+    batch gets a column.
+    """
+    extracted = [result.extracted_fields or {} for result in results]
+    if fields is None:
+        fields = dict.fromkeys(key for item in extracted for key in item)
+    return {name: [item.get(name) for item in extracted] for name in fields}
 
 
 # Global instance
@@ -760,6 +1016,14 @@ def analyze_document(
     return ocr_service.analyze_document(image_bytes, document_type, country_code, side)
 
 
+def analyze_documents_batch(
+    items: List[Tuple[bytes, str, str, str]],
+    max_concurrency: int = 8
+) -> List[OCRResult]:
+    """Convenience function for concurrent analysis of several documents."""
+    return ocr_service.analyze_documents_batch(items, max_concurrency)
+
+
 def get_call_count() -> int:
     """Get total API calls made."""
     return ocr_service.call_count
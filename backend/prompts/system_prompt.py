@@ -5,6 +5,9 @@ These prompts guide Gemini LLM to generate user-friendly guidance
 for fixing document issues during KYC verification.
 """
 
+import random
+from functools import lru_cache
+
 # ============================================================================
 # MAIN SYSTEM PROMPT
 # ============================================================================
@@ -284,28 +287,36 @@ FALLBACK_GUIDANCE = {
 }
 
 
+@lru_cache(maxsize=32)
 def get_issue_prompt(issue_type: str) -> str:
     """Get specific guidance prompt for an issue type."""
     return ISSUE_PROMPTS.get(issue_type.upper(), ISSUE_PROMPTS.get("TEXT_UNREADABLE"))
 
 
+@lru_cache(maxsize=32)
 def get_language_template(language: str = "en") -> dict:
     """Get language-specific template strings."""
     return LANGUAGE_TEMPLATES.get(language.lower(), LANGUAGE_TEMPLATES["en"])
 
 
-def get_encouragement(attempt: int, success: bool = False) -> str:
-    """Get appropriate encouragement message based on attempt number."""
-    import random
-    
+@lru_cache(maxsize=32)
+def _encouragement_pool(attempt: int, success: bool) -> list:
+    """Pick the encouragement message list for an (attempt, success) pair."""
     if success:
-        return random.choice(ENCOURAGEMENT_MESSAGES["success"])
+        return ENCOURAGEMENT_MESSAGES["success"]
     elif attempt == 1:
-        return random.choice(ENCOURAGEMENT_MESSAGES["first_attempt"])
+        return ENCOURAGEMENT_MESSAGES["first_attempt"]
     elif attempt <= 3:
-        return random.choice(ENCOURAGEMENT_MESSAGES["retry_attempt"])
+        return ENCOURAGEMENT_MESSAGES["retry_attempt"]
     else:
-        return random.choice(ENCOURAGEMENT_MESSAGES["multiple_retries"])
+        return ENCOURAGEMENT_MESSAGES["multiple_retries"]
+
+
+def get_encouragement(attempt: int, success: bool = False) -> str:
+    """Get appropriate encouragement message based on attempt number."""
+    # Attempts past 3 all share a pool; cap the key to bound the cache.
+    # The message itself stays random per call.
+    return random.choice(_encouragement_pool(min(attempt, 4), success))
 
 
 def format_guidance_prompt(
@@ -8,12 +8,19 @@ Provides:
 - Persistent storage in session state
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, Optional, List, Tuple
+from typing import ClassVar, Dict, Optional, List, Tuple
 from enum import Enum
 
 
+# Status colors returned by UsageTracker.get_status_message
+COLOR_GREEN = "#28a745"
+COLOR_YELLOW = "#ffc107"
+COLOR_RED = "#dc3545"
+
+
 class UsageLevel(Enum):
     """API usage warning levels."""
     GREEN = "green"      # < 50 calls - all good
@@ -49,24 +56,23 @@ class UsageStats:
     total_calls: int = 0
     session_start: datetime = field(default_factory=datetime.now)
     last_call: Optional[datetime] = None
-    field_retries: Dict[str, FieldRetryInfo] = field(default_factory=dict)
+    field_retries: Dict[Tuple[str, str], FieldRetryInfo] = field(default_factory=dict)
+    
+    # Limits (class constants, not per-instance fields)
+    WARNING_THRESHOLD: ClassVar[int] = 50
+    CRITICAL_THRESHOLD: ClassVar[int] = 80
+    DAILY_LIMIT: ClassVar[int] = 100
     
-    # Limits
-    WARNING_THRESHOLD: int = 50
-    CRITICAL_THRESHOLD: int = 80
-    DAILY_LIMIT: int = 100
+    # Level lookup: the number of thresholds reached indexes _LEVELS
+    _THRESHOLDS: ClassVar[Tuple[int, ...]] = (WARNING_THRESHOLD, CRITICAL_THRESHOLD, DAILY_LIMIT)
+    _LEVELS: ClassVar[Tuple[UsageLevel, ...]] = (
+        UsageLevel.GREEN, UsageLevel.YELLOW, UsageLevel.RED, UsageLevel.BLOCKED
+    )
     
     @property
     def usage_level(self) -> UsageLevel:
         """Get current usage warning level."""
-        if self.total_calls >= self.DAILY_LIMIT:
-            return UsageLevel.BLOCKED
-        elif self.total_calls >= self.CRITICAL_THRESHOLD:
-            return UsageLevel.RED
-        elif self.total_calls >= self.WARNING_THRESHOLD:
-            return UsageLevel.YELLOW
-        else:
-            return UsageLevel.GREEN
+        return self._LEVELS[bisect_right(self._THRESHOLDS, self.total_calls)]
     
     @property
     def remaining_calls(self) -> int:
@@ -127,17 +133,44 @@ class UsageTracker:
         self._stats.total_calls += 1
         self._stats.last_call = datetime.now()
         
+        return True, self._remaining_calls_message()
+    
+    def record_calls(self, count: int) -> Tuple[bool, str]:
+        """
+        Record several API calls at once.
+        
+        Calls past the daily limit are rejected, as with record_call.
+        
+        Returns:
+            Tuple of (all_recorded, message)
+        """
+        if count <= 0:
+            return True, ""
+        
+        accepted = min(count, self._stats.remaining_calls)
+        if accepted == 0:
+            return False, "API limit reached. Please try again tomorrow."
+        
+        self._stats.total_calls += accepted
+        self._stats.last_call = datetime.now()
+        
+        if accepted < count:
+            return False, "API limit reached. Please try again tomorrow."
+        return True, self._remaining_calls_message()
+    
+    def _remaining_calls_message(self) -> str:
+        """Get the remaining-calls note for the current usage level."""
         level = self._stats.usage_level
         if level == UsageLevel.RED:
-            return True, f"Warning: {self._stats.remaining_calls} API calls remaining today"
+            return f"Warning: {self._stats.remaining_calls} API calls remaining today"
         elif level == UsageLevel.YELLOW:
-            return True, f"Note: {self._stats.remaining_calls} API calls remaining"
+            return f"Note: {self._stats.remaining_calls} API calls remaining"
         else:
-            return True, ""
+            return ""
     
-    def get_field_key(self, document_type: str, side: str) -> str:
+    def get_field_key(self, document_type: str, side: str) -> Tuple[str, str]:
         """Generate unique key for document field."""
-        return f"{document_type}_{side}"
+        return (document_type, side)
     
     def can_retry_field(self, document_type: str, side: str) -> Tuple[bool, int]:
         """
@@ -162,31 +195,62 @@ class UsageTracker:
         Returns:
             Tuple of (success, message)
         """
+        retry_info = self._get_retry_info(document_type, side)
+        
+        if not retry_info.can_retry:
+            return False, f"Maximum retries ({retry_info.max_attempts}) reached for this document. Please contact support."
+        
+        retry_info.attempts += 1
+        retry_info.last_attempt = datetime.now()
+        
+        return True, self._remaining_attempts_message(retry_info)
+    
+    def record_field_attempts(self, document_type: str, side: str, count: int) -> Tuple[bool, str]:
+        """
+        Record several attempts for a document field at once.
+        
+        Attempts past the retry limit are rejected, as with record_field_attempt.
+        
+        Returns:
+            Tuple of (all_recorded, message)
+        """
+        retry_info = self._get_retry_info(document_type, side)
+        if count <= 0:
+            return True, ""
+        
+        accepted = min(count, retry_info.remaining_attempts)
+        retry_info.attempts += accepted
+        if accepted:
+            retry_info.last_attempt = datetime.now()
+        
+        if accepted < count:
+            return False, f"Maximum retries ({retry_info.max_attempts}) reached for this document. Please contact support."
+        return True, self._remaining_attempts_message(retry_info)
+    
+    def _get_retry_info(self, document_type: str, side: str) -> FieldRetryInfo:
+        """Get the retry info for a field, creating it on first use."""
         key = self.get_field_key(document_type, side)
         retry_info = self._stats.field_retries.get(key)
         
         if retry_info is None:
             retry_info = FieldRetryInfo(
-                field_id=key,
+                field_id=f"{document_type}_{side}",
                 document_type=document_type,
                 side=side,
                 attempts=0
             )
             self._stats.field_retries[key] = retry_info
-        
-        if not retry_info.can_retry:
-            return False, f"Maximum retries ({retry_info.max_attempts}) reached for this document. Please contact support."
-        
-        retry_info.attempts += 1
-        retry_info.last_attempt = datetime.now()
-        
+        return retry_info
+    
+    def _remaining_attempts_message(self, retry_info: FieldRetryInfo) -> str:
+        """Get the remaining-retries note for a field."""
         remaining = retry_info.remaining_attempts
         if remaining == 0:
-            return True, "This was your last attempt for this document."
+            return "This was your last attempt for this document."
         elif remaining == 1:
-            return True, f"1 retry remaining for this document."
+            return f"1 retry remaining for this document."
         else:
-            return True, ""
+            return ""
     
     def reset_field(self, document_type: str, side: str) -> None:
         """Reset retry count for a specific field (admin use)."""
@@ -213,25 +277,25 @@ class UsageTracker:
             return (
                 "blocked",
                 "Daily API limit reached. Please try again tomorrow or contact support.",
-                "#dc3545"  # Red
+                COLOR_RED
             )
         elif level == UsageLevel.RED:
             return (
                 "critical",
                 f" Critical: Only {remaining} API calls remaining today. Use them wisely!",
-                "#dc3545"  # Red
+                COLOR_RED
             )
         elif level == UsageLevel.YELLOW:
             return (
                 "warning", 
                 f"📊 {remaining} API calls remaining today ({total} used)",
-                "#ffc107"  # Yellow
+                COLOR_YELLOW
             )
         else:
             return (
                 "ok",
                 f" API usage: {total}/{self._stats.DAILY_LIMIT} calls today",
-                "#28a745"  # Green
+                COLOR_GREEN
             )
     
     def get_field_status(self, document_type: str, side: str) -> Dict:
@@ -268,12 +332,12 @@ class UsageTracker:
             "session_start": self._stats.session_start.isoformat(),
             "last_call": self._stats.last_call.isoformat() if self._stats.last_call else None,
             "field_retries": {
-                key: {
+                info.field_id: {
                     "attempts": info.attempts,
                     "document_type": info.document_type,
                     "side": info.side
                 }
-                for key, info in self._stats.field_retries.items()
+                for info in self._stats.field_retries.values()
             }
         }
     
@@ -290,11 +354,15 @@ class UsageTracker:
             self._stats.last_call = datetime.fromisoformat(last_call)
         
         field_retries = data.get("field_retries", {})
-        for key, info in field_retries.items():
-            self._stats.field_retries[key] = FieldRetryInfo(
-                field_id=key,
-                document_type=info.get("document_type", ""),
-                side=info.get("side", ""),
+        for field_id, info in field_retries.items():
+            # Older exports may lack the parts; recover them from "<type>_<side>"
+            default_type, _, default_side = field_id.rpartition("_")
+            document_type = info.get("document_type", default_type)
+            side = info.get("side", default_side)
+            self._stats.field_retries[(document_type, side)] = FieldRetryInfo(
+                field_id=field_id,
+                document_type=document_type,
+                side=side,
                 attempts=info.get("attempts", 0)
             )
 
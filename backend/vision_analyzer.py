@@ -5,7 +5,7 @@ Extracts document features and assesses quality using AI.
 
 import google.generativeai as genai
 from typing import Optional
-import json
+import orjson
 import time
 import re
 import logging
@@ -329,10 +329,10 @@ IMPORTANT RULES:
                 cleaned = cleaned[start:end + 1]
 
             # Parse JSON
-            result = json.loads(cleaned)
+            result = orjson.loads(cleaned)
             return result
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             # Attempt a best-effort recovery by finding the last balanced brace
             recovered = None
             if "{" in response_text:
@@ -374,7 +374,7 @@ IMPORTANT RULES:
                     if last_balanced_idx is not None:
                         candidate = text[start:last_balanced_idx + 1]
                         try:
-                            recovered = json.loads(candidate)
+                            recovered = orjson.loads(candidate)
                         except Exception:
                             recovered = None
 
@@ -6,7 +6,7 @@ compatible with Deriv's verification API format.
 
 from enum import Enum
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 
@@ -57,6 +57,9 @@ class IssueType(str, Enum):
 
 class DetectedIssue(BaseModel):
     """Represents a single issue detected in a document."""
+    # Issues are never edited after detection; frozen makes them hashable
+    model_config = ConfigDict(frozen=True)
+    
     issue_type: IssueType
     severity: IssueSeverity
     description: str
@@ -9,6 +9,7 @@ Provides:
 """
 
 import json
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Union
 from pydantic import BaseModel, Field, field_validator
@@ -74,6 +75,11 @@ class FormField(BaseModel):
     ocr_field: bool = False  # Can be extracted via OCR
     error: Optional[str] = None
 
+    @cached_property
+    def is_cnic(self) -> bool:
+        """Whether this is a Pakistani CNIC field (auto-formatted XXXXX-XXXXXXX-X)."""
+        return self.id == "cnic" or bool(self.mask and "XXXXX-XXXXXXX-X" in self.mask)
+
 
 class DocumentSpec(BaseModel):
     """Specification for a required document."""
@@ -13,7 +13,9 @@ import streamlit as st
 import base64
 import time
 import requests
+from functools import lru_cache
 from io import BytesIO
+from types import MappingProxyType
 from PIL import Image, ImageFilter, ImageStat
 
 # ============================================================================
@@ -139,10 +141,16 @@ def get_api_base():
     return "http://localhost:8000"
 
 
+def _freeze(records):
+    """Read-only view of a list of dicts, safe to hand out from a cache."""
+    return tuple(MappingProxyType(record) for record in records)
+
+
+@lru_cache(maxsize=1)
 def get_countries():
     """Fetch countries from API."""
     # Fallback data if API not available
-    return [
+    return _freeze([
         {"code": "PK", "name": "Pakistan"},
         {"code": "IN", "name": "India"},
         {"code": "NG", "name": "Nigeria"},
@@ -150,9 +158,10 @@ def get_countries():
         {"code": "GB", "name": "United Kingdom"},
         {"code": "DE", "name": "Germany"},
         {"code": "UAE", "name": "United Arab Emirates"}
-    ]
+    ])
 
 
+@lru_cache(maxsize=64)
 def get_documents(country_code):
     """Get documents for a country."""
     # Fallback data
@@ -187,7 +196,7 @@ def get_documents(country_code):
             {"doc_type": "passport", "name": "Passport", "requires_back": False}
         ]
     }
-    return documents.get(country_code, [])
+    return _freeze(documents.get(country_code, []))
 
 
 def estimate_quality(image_bytes):
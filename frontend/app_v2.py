@@ -13,6 +13,7 @@ import json
 import base64
 import os
 import sys
+from dataclasses import replace
 from pathlib import Path
 from datetime import date
 from typing import Dict, Any, List, Optional, Tuple
@@ -923,7 +924,7 @@ def render_document_upload(
                                     "message": f"Bill dated {bill_date_str} is older than 3 months. Please upload a recent bill.",
                                     "suggestion": "Upload a bill dated within the last 3 months"
                                 })
-                                result.quality_score = min(result.quality_score, 30)
+                                result = replace(result, quality_score=min(result.quality_score, 30))
                     else:
                         result.issues.append({
                             "type": "MISSING_DATE",
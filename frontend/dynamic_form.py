@@ -11,6 +11,7 @@ Provides Streamlit components that:
 
 import streamlit as st
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Callable
 import re
 import sys
@@ -31,6 +32,34 @@ from config.kyc_schema_loader import (
     get_supported_countries
 )
 
+# Strips everything but digits when auto-formatting CNIC input
+_NON_DIGIT = re.compile(r"\D")
+
+# ASCII punctuation that Streamlit markdown could treat as syntax
+# (emphasis, links, headings, lists, LaTeX, emoji shortcodes)
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_{}\[\]()#+\-.!|<>~$:])")
+
+
+def _escape_markdown(value: Any) -> str:
+    """Backslash-escape a user-entered value so markdown shows it as typed."""
+    return _MARKDOWN_SPECIAL.sub(r"\\\1", " ".join(str(value).split()))
+
+
+# =============================================================================
+# SCHEMA LOOKUPS
+# =============================================================================
+
+@lru_cache(maxsize=16)
+def _cached_schema(country_code: str) -> Optional[CountryKYCSchema]:
+    """Get schema for a country, memoized since schemas are static."""
+    return get_country_schema(country_code)
+
+
+@lru_cache(maxsize=1)
+def _cached_supported_countries() -> tuple:
+    """Get supported countries, memoized since the list is static."""
+    return tuple(get_supported_countries())
+
 
 # =============================================================================
 # SESSION STATE MANAGEMENT
@@ -125,7 +154,9 @@ def sync_form_data_to_widgets(prefix: str = "kyc") -> None:
             if isinstance(value, str) and value.strip() != "":
                 st.session_state[widget_key] = value
             elif isinstance(value, bool):
-                st.session_state[widget_key] = value
+                # Boolean/checkbox widgets restore themselves from form data;
+                # leaving their keys to the widget keeps radio state "Yes"/"No"
+                continue
             elif value not in [None, "", 0]:  # Don't sync empty/zero values
                 st.session_state[widget_key] = value
 
@@ -284,7 +315,7 @@ def render_id_field(
     label = f"{field.label} *" if field.required else field.label
     
     # Check if this is a CNIC field (Pakistan) - auto-format with dashes
-    is_cnic = field.id == "cnic" or (field.mask and "XXXXX-XXXXXXX-X" in field.mask)
+    is_cnic = field.is_cnic
     
     # Format placeholder for better UX
     placeholder = field.placeholder or ""
@@ -317,7 +348,7 @@ def render_id_field(
     # Auto-format CNIC as user types: XXXXX-XXXXXXX-X
     if is_cnic and value:
         # Remove existing dashes and non-digits
-        digits_only = ''.join(c for c in value if c.isdigit())
+        digits_only = _NON_DIGIT.sub('', value)
         
         # Format with dashes: 5-7-1 pattern
         if len(digits_only) > 0:
@@ -477,6 +508,10 @@ def render_select_field(
     return value, None
 
 
+# Radio options for boolean fields; index 1 ("Yes") maps to True
+_BOOLEAN_OPTIONS = ("No", "Yes")
+
+
 def render_boolean_field(
     field: FormField,
     prefix: str = "kyc",
@@ -489,26 +524,18 @@ def render_boolean_field(
     
     # Get current value - check widget first, then form data, then default
     if key in st.session_state:
-        # Normalize stored value to radio options
-        if isinstance(st.session_state[key], bool):
-            st.session_state[key] = "Yes" if st.session_state[key] else "No"
-        elif st.session_state[key] not in ["Yes", "No"]:
-            del st.session_state[key]
-        # Convert radio selection back to boolean
-        current_value = st.session_state.get(key) == "Yes"
+        # Widget state is only ever written by the radio itself ("Yes"/"No")
+        current_value = st.session_state[key] == "Yes"
     else:
         current_value = get_form_value(field.id, prefix)
         if current_value is None:
             current_value = field.default if field.default is not None else False
     
     # Use radio for boolean questions
-    options = ["No", "Yes"]
-    index = 1 if current_value else 0
-    
     value_str = st.radio(
         label,
-        options=options,
-        index=index,
+        options=_BOOLEAN_OPTIONS,
+        index=int(bool(current_value)),
         key=key,
         help=field.help,
         horizontal=True,
@@ -676,7 +703,7 @@ def render_kyc_form(
     init_form_state(prefix)
 
     # Load schema
-    schema = get_country_schema(country_code)
+    schema = _cached_schema(country_code)
     if not schema:
         st.error(f" Country not supported: {country_code}")
         return {"form_data": {}, "is_valid": False, "errors": {"_form": "Unsupported country"}}
@@ -700,11 +727,7 @@ def render_kyc_form(
     
     # Progress bar
     if show_progress:
-        form_data = get_all_form_data(prefix)
-        required_fields = schema.get_all_required_fields()
-        filled = sum(1 for f in required_fields if form_data.get(f.id))
-        progress = filled / len(required_fields) if required_fields else 0
-        st.progress(progress, text=f"Progress: {filled}/{len(required_fields)} required fields completed")
+        _render_progress_and_summary(schema, prefix, show_progress=True, show_summary=False)
     
     st.markdown("---")
     
@@ -725,10 +748,63 @@ def render_kyc_form(
     
     st.markdown("---")
     
-    # Validate form
+    # Validate form and show status (no button - navigation is in kyc_onboarding.py)
+    return _render_progress_and_summary(schema, prefix, show_progress=False, show_summary=True)
+
+
+def _validate_form_cached(
+    schema: CountryKYCSchema,
+    form_data: Dict[str, Any],
+    prefix: str = "kyc"
+) -> Dict[str, Any]:
+    """
+    Validate form data, reusing the last result if the data is unchanged.
+    
+    The result is cached in session state keyed by the country and a sorted
+    tuple of the form data items.
+    """
+    cache_key = f"{prefix}__last_validation"
+    try:
+        fd_key = (schema.country_code, tuple(sorted(form_data.items(), key=lambda kv: kv[0])))
+        hash(fd_key)
+    except TypeError:
+        # Unhashable values - validate without caching
+        return FormDataValidator(schema).validate_form(form_data)
+    
+    cached = st.session_state.get(cache_key)
+    if cached is not None and cached[0] == fd_key:
+        return cached[1]
+    
+    validation_result = FormDataValidator(schema).validate_form(form_data)
+    st.session_state[cache_key] = (fd_key, validation_result)
+    return validation_result
+
+
+def _render_progress_and_summary(
+    schema: CountryKYCSchema,
+    prefix: str = "kyc",
+    show_progress: bool = True,
+    show_summary: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Render the progress bar and/or validation summary of the KYC form.
+    
+    Returns:
+        Dict with form_data, is_valid, errors when show_summary is set
+    """
     form_data = get_all_form_data(prefix)
-    validator = FormDataValidator(schema)
-    validation_result = validator.validate_form(form_data)
+    
+    if show_progress:
+        required_fields = schema.get_all_required_fields()
+        filled = sum(1 for f in required_fields if form_data.get(f.id))
+        progress = filled / len(required_fields) if required_fields else 0
+        st.progress(progress, text=f"Progress: {filled}/{len(required_fields)} required fields completed")
+    
+    if not show_summary:
+        return None
+    
+    # Validate form
+    validation_result = _validate_form_cached(schema, form_data, prefix)
     
     # Debug: Always show form data and errors for troubleshooting
     # with st.expander("Debug: Form Data & Validation", expanded=False):
@@ -738,7 +814,6 @@ def render_kyc_form(
     #     st.json(validation_result["errors"])
     #     st.write(f"**Is Valid:** {validation_result['is_valid']}")
     
-    # Show status (no button - navigation is in kyc_onboarding.py)
     if validation_result["is_valid"]:
         st.success("All required fields are valid. You can proceed.")
     
@@ -799,7 +874,7 @@ def render_country_selector(
     on_change: Optional[Callable[[str], None]] = None
 ) -> Optional[str]:
     """Render country selector dropdown."""
-    countries = get_supported_countries()
+    countries = _cached_supported_countries()
     
     if not countries:
         st.error("No countries configured")
@@ -837,7 +912,7 @@ def render_form_summary(
     prefix: str = "kyc"
 ) -> None:
     """Render a summary of submitted form data."""
-    schema = get_country_schema(country_code)
+    schema = _cached_schema(country_code)
     if not schema:
         return
     
@@ -851,7 +926,8 @@ def render_form_summary(
     )
     
     for cat_name, category in sorted_categories:
-        st.markdown(f"**{category.label}**")
+        # One markdown element per category instead of one per field
+        lines = [f"**{category.label}**"]
         
         for field in category.required_fields + category.optional_fields:
             value = form_data.get(field.id)
@@ -861,6 +937,7 @@ def render_form_summary(
                 if field.type == FieldType.ID and len(str(value)) > 4:
                     display_value = str(value)[:4] + "*" * (len(str(value)) - 4)
                 
-                st.text(f"  {field.label}: {display_value}")
+                lines.append(f"- {field.label}: {_escape_markdown(display_value)}")
         
+        st.markdown("\n".join(lines))
         st.markdown("")
@@ -17,7 +17,8 @@ from datetime import date
 import time
 import json
 import base64
-import requests
+import httpx
+import orjson
 import os
 import hashlib
 from typing import Optional
@@ -329,6 +330,17 @@ def scroll_to_top():
     )
 
 
+def get_http_session() -> httpx.Client:
+    """Per-user HTTP client so backend calls reuse keep-alive connections across reruns.
+
+    Kept in session_state rather than st.cache_resource so cookies and
+    connection state are never shared between users.
+    """
+    if "http_client" not in st.session_state:
+        st.session_state.http_client = httpx.Client()
+    return st.session_state.http_client
+
+
 def get_file_signature(uploaded_file) -> Optional[str]:
     if uploaded_file is None:
         return None
@@ -642,40 +654,48 @@ def analyze_document_image(file, document_type: str, country_code: str, side: st
     Returns analysis results including quality assessment and OCR data.
     """
     try:
-        # Convert file to base64
+        # Read raw bytes; base64 is only needed for the direct fallback
         file.seek(0)
         image_bytes = file.read()
-        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
         file.seek(0)  # Reset for potential re-read
         
-        # Try to call the backend API
-        api_url = "http://localhost:8000/analyze"
+        # Try to call the backend API with a multipart upload
+        api_url = "http://localhost:8000/analyze/upload"
         
-        payload = {
-            "image_base64": image_base64,
+        files = {
+            "file": (
+                getattr(file, "name", "document"),
+                image_bytes,
+                getattr(file, "type", None) or "application/octet-stream"
+            )
+        }
+        form = {
             "document_type": document_type,
             "country_code": country_code,
             "side": side
         }
         
+        session = get_http_session()
         try:
-            response = requests.post(api_url, json=payload, timeout=120)
-        except requests.exceptions.Timeout:
+            response = session.post(api_url, files=files, data=form, timeout=120)
+        except httpx.TimeoutException:
             # Retry once on timeout
-            response = requests.post(api_url, json=payload, timeout=120)
+            response = session.post(api_url, files=files, data=form, timeout=120)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             # Ensure extracted_data is accessible at the right path for comparison
             if "extracted_data" in result and "vision_result" not in result:
                 result["vision_result"] = {"extracted_data": result["extracted_data"]}
             return result
         else:
             # Fallback to direct analysis if API not available
+            image_base64 = base64.b64encode(image_bytes).decode('utf-8')
             return analyze_document_directly(image_base64, document_type, country_code, side)
             
-    except requests.exceptions.ConnectionError:
-        # API not running, try direct analysis
+    except httpx.TransportError:
+        # API not running or the connection dropped, try direct analysis
+        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
         return analyze_document_directly(image_base64, document_type, country_code, side)
     except Exception as e:
         return {
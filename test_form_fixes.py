@@ -2,26 +2,58 @@
 Test script to verify form fixes
 
 This script helps verify that the form data persistence issues have been resolved.
+
+Usage:
+    streamlit run test_form_fixes.py   # renders the results as a page
+    python test_form_fixes.py          # headless check, no Streamlit import
 """
 
-import streamlit as st
 import sys
+import types
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from frontend.dynamic_form import (
-    init_form_state,
-    get_all_form_data,
-    set_form_value,
-    get_form_value,
-    sync_form_data_to_widgets
-)
 
-def test_form_persistence():
-    """Test form data persistence"""
+def _fake_streamlit() -> types.ModuleType:
+    """Stand-in for the parts of Streamlit the persistence check touches.
+
+    A headless run only needs session_state, so this avoids pulling in
+    Streamlit's pyarrow/pandas/tornado import chain.
+    """
+    fake_st = types.ModuleType("streamlit")
+    fake_st.session_state = {}
+    fake_st.write = fake_st.json = fake_st.success = fake_st.error = print
+    return fake_st
+
+
+@pytest.fixture
+def fake_streamlit(monkeypatch):
+    """Import frontend.dynamic_form against the stub for this test only."""
+    import frontend
+    original = sys.modules.get("frontend.dynamic_form")
+    
+    fake_st = _fake_streamlit()
+    monkeypatch.setitem(sys.modules, "streamlit", fake_st)
+    monkeypatch.delitem(sys.modules, "frontend.dynamic_form", raising=False)
+    yield fake_st
+    
+    # Drop the copy bound to the stub; monkeypatch restores sys.modules after
+    sys.modules.pop("frontend.dynamic_form", None)
+    if original is not None:
+        frontend.dynamic_form = original
+    else:
+        vars(frontend).pop("dynamic_form", None)
+
+
+def check_form_persistence() -> bool:
+    """Round-trip sample values through the form state. Returns True if all match."""
+    import streamlit as st
+    from frontend.dynamic_form import get_all_form_data, init_form_state, set_form_value
     
     # Initialize form state
     init_form_state("test")
@@ -66,8 +98,25 @@ def test_form_persistence():
             stored_value = stored_data.get(key)
             if stored_value != original_value:
                 st.error(f"Mismatch for {key}: Expected {original_value}, Got {stored_value}")
+    
+    return all_match
+
+
+def test_form_persistence(fake_streamlit):
+    """Test form data persistence"""
+    assert check_form_persistence(), "Form data persistence has issues"
+
 
 if __name__ == "__main__":
+    # `streamlit run` imports Streamlit before executing this script; a plain
+    # `python` run gets the stub and a headless check instead
+    if "streamlit" not in sys.modules:
+        sys.modules["streamlit"] = _fake_streamlit()
+        assert check_form_persistence(), "Form data persistence has issues"
+        sys.exit(0)
+    
+    import streamlit as st
+    
     st.set_page_config(
         page_title="Form Fixes Test",
         page_icon="🔧",
@@ -76,4 +125,4 @@ if __name__ == "__main__":
     
     st.title("🔧 Form Data Persistence Test")
     
-    test_form_persistence()
\ No newline at end of file
+    check_form_persistence()
\ No newline at end of file
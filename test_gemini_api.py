@@ -43,12 +43,17 @@ except Exception as e:
 
 # List available models
 print("\n--- Available Models ---")
+# Stream the catalog and keep only the names that can generate content;
+# None means the catalog is unknown and every candidate gets probed
+available_models = None
 try:
-    models = list(genai.list_models())
-    for model in models:
-        supported = "generateContent" in [m.name for m in model.supported_generation_methods] if hasattr(model, 'supported_generation_methods') else "unknown"
+    available_models = set()
+    for model in genai.list_models():
         print(f"  - {model.name}")
+        if "generateContent" in getattr(model, 'supported_generation_methods', []):
+            available_models.add(model.name)
 except Exception as e:
+    available_models = None
     print(f"✗ Failed to list models: {e}")
 
 # Test each model
@@ -62,20 +67,58 @@ test_models = [
     'gemini-2.0-flash',
 ]
 
-working_model = None
-for model_name in test_models:
+# GenerativeModel objects by name, reused by the probes and the vision test
+model_cache = {}
+
+
+def get_model(model_name):
+    """Get a cached GenerativeModel for a model name."""
+    if model_name not in model_cache:
+        model_cache[model_name] = genai.GenerativeModel(model_name)
+    return model_cache[model_name]
+
+
+def probe_model(model_name):
+    """Send a tiny prompt to a model. Returns (model_name, status, message)."""
     try:
-        print(f"\nTesting {model_name}...")
-        model = genai.GenerativeModel(model_name)
+        model = get_model(model_name)
         response = model.generate_content("Reply with just 'OK'")
         if response and response.text:
-            print(f"  ✓ {model_name} works! Response: {response.text.strip()}")
-            if working_model is None:
-                working_model = model_name
-        else:
-            print(f"  ? {model_name} returned empty response")
+            return model_name, "✓", f"works! Response: {response.text.strip()}"
+        return model_name, "?", "returned empty response"
     except Exception as e:
-        print(f"  ✗ {model_name} failed: {str(e)[:100]}")
+        return model_name, "✗", f"failed: {str(e)[:100]}"
+
+
+def canonical_model_name(model_name):
+    """'gemini-2.5-flash' and 'models/gemini-2.5-flash' are the same model."""
+    return model_name if model_name.startswith("models/") else f"models/{model_name}"
+
+
+# Each probe is a billed call, so drop aliases of models already listed
+seen = set()
+unique_models = []
+for model_name in test_models:
+    canonical = canonical_model_name(model_name)
+    if canonical in seen:
+        continue
+    seen.add(canonical)
+    # Skip models the catalog doesn't offer - no need to spend a call
+    if available_models is not None and canonical not in available_models:
+        print(f"  - {model_name} not in catalog, skipping")
+        continue
+    unique_models.append(model_name)
+
+# Probe in list order and stop at the first model that works, so models
+# after it are never called (or billed)
+working_model = None
+for model_name in unique_models:
+    print(f"\nTesting {model_name}...")
+    _, status, message = probe_model(model_name)
+    print(f"  {status} {model_name} {message}")
+    if status == "✓":
+        working_model = model_name
+        break
 
 if working_model:
     print(f"\n✓ SUCCESS: Use model '{working_model}' for your application")
@@ -87,14 +130,13 @@ print("\n--- Testing Vision Capability ---")
 test_image_path = project_root / "test_image.jpg"
 if test_image_path.exists():
     try:
-        import base64
-        with open(test_image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode()
+        # The SDK accepts raw bytes and encodes them itself
+        image_bytes = test_image_path.read_bytes()
 
-        model = genai.GenerativeModel(working_model or 'gemini-2.5-flash')
+        model = get_model(working_model or 'gemini-2.5-flash')
         response = model.generate_content([
             "What do you see in this image? Reply briefly.",
-            {"mime_type": "image/jpeg", "data": image_data}
+            {"mime_type": "image/jpeg", "data": image_bytes}
         ])
         print(f"  ✓ Vision test successful: {response.text[:100]}...")
     except Exception as e:
@@ -0,0 +1,23 @@
+"""Shared pytest setup for the KYC agent test suite."""
+
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+
+# Make the project root importable (backend, config, frontend packages)
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Make time.sleep a no-op so rate limiters and simulated delays cost nothing."""
+    monkeypatch.setattr("time.sleep", lambda *_: None)
+
+
+@pytest.fixture(scope="session")
+def country_forms():
+    """Parsed config/country_forms.json, read once per test session."""
+    return orjson.loads((ROOT / "config" / "country_forms.json").read_bytes())
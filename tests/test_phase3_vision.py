@@ -5,45 +5,97 @@ Tests image processing, vision analysis, and feature extraction.
 
 import sys
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import numpy as np
+import pytest
 from PIL import Image
+from copy import deepcopy
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import io
 import base64
 
 
+# Mock vision result (simulating what Gemini would return)
+MOCK_VISION_RESULT_ID = {
+    "detected_document_type": "national_id",
+    "detected_side": "front",
+    "is_correct_document": True,
+    "document_visible": True,
+    "quality_assessment": {
+        "is_readable": True,
+        "is_blurry": False,
+        "has_glare": False,
+        "is_too_dark": False,
+        "is_too_bright": False,
+        "all_corners_visible": True,
+        "is_rotated": False,
+        "has_obstructions": False
+    },
+    "detected_elements": {
+        "has_photo": True,
+        "has_name_field": True,
+        "has_id_number": True,
+        "has_date_of_birth": True,
+        "has_expiry_date": False,
+        "has_mrz_zone": False
+    },
+    "issues_found": [],
+    "confidence_score": 0.95
+}
+
+# Passport variant: same document with a machine-readable zone
+MOCK_VISION_RESULT_PASSPORT = deepcopy(MOCK_VISION_RESULT_ID)
+MOCK_VISION_RESULT_PASSPORT["detected_elements"]["has_mrz_zone"] = True
+
+
 def create_test_image(width=800, height=500, color=(200, 200, 200)):
     """Create a simple test image."""
-    img = Image.new('RGB', (width, height), color)
+    # Paint into a NumPy array with slice writes instead of ImageDraw calls
+    arr = np.full((height, width, 3), color, dtype=np.uint8)
     
-    # Add some variation to make it not completely uniform
-    from PIL import ImageDraw
-    draw = ImageDraw.Draw(img)
-    
-    # Draw a rectangle (simulating a document)
+    # Draw a rectangle (simulating a document), 3px outline
     margin = 50
-    draw.rectangle(
-        [margin, margin, width - margin, height - margin],
-        outline=(100, 100, 100),
-        width=3
-    )
+    border = 3
+    outline = (100, 100, 100)
+    arr[margin:margin + border, margin:width - margin + 1] = outline
+    arr[height - margin - border + 1:height - margin + 1, margin:width - margin + 1] = outline
+    arr[margin:height - margin + 1, margin:margin + border] = outline
+    arr[margin:height - margin + 1, width - margin - border + 1:width - margin + 1] = outline
     
-    # Add some text-like lines
-    for i in range(5):
-        y = 100 + i * 50
-        draw.line([(100, y), (width - 100, y)], fill=(50, 50, 50), width=2)
+    # Add some text-like lines, 2px thick, painted in one fancy-indexed write
+    line_rows = [100 + i * 50 + dy for i in range(5) for dy in (0, 1)]
+    line_rows = [r for r in line_rows if r < height]
+    if line_rows:
+        arr[line_rows, 100:width - 100 + 1] = (50, 50, 50)
     
-    return img
+    return Image.fromarray(arr, 'RGB')
 
 
 def image_to_bytes(img, format='JPEG'):
     """Convert PIL Image to bytes."""
     buffer = io.BytesIO()
-    img.save(buffer, format=format)
+    if format.upper() == 'JPEG':
+        # Single-pass baseline encode: no Huffman optimization pass
+        img.save(buffer, format=format, quality=85, optimize=False, progressive=False, subsampling=2)
+    else:
+        img.save(buffer, format=format)
     buffer.seek(0)
     return buffer.read()
 
 
+@lru_cache(maxsize=8)
+def _cached_test_image(width=800, height=500, color=(200, 200, 200)):
+    """Create a test image once per size/color. Call .copy() before mutating."""
+    return create_test_image(width, height, color)
+
+
+@lru_cache(maxsize=8)
+def _cached_test_bytes(width=800, height=500, color=(200, 200, 200), format='JPEG'):
+    """Encode the cached test image once per size/color/format."""
+    return image_to_bytes(_cached_test_image(width, height, color), format)
+
+
 def test_image_processor():
     """Test image processing functions."""
     print("=" * 60)
@@ -60,8 +112,7 @@ def test_image_processor():
     )
     
     # Create test image
-    test_img = create_test_image()
-    test_bytes = image_to_bytes(test_img)
+    test_bytes = _cached_test_bytes(800, 500, (200, 200, 200), 'JPEG')
     
     # Test 1.1: Validate format
     print("\n1.1 Validating image format...")
@@ -110,6 +161,30 @@ def test_image_processor():
     return True
 
 
+def test_prepare_for_upload():
+    """Large images are downscaled to JPEG; small JPEGs and unreadable bytes pass through."""
+    from backend.image_processor import prepare_for_upload, TARGET_SIZE
+    
+    large = _cached_test_bytes(2048, 1280, (200, 200, 200), 'PNG')
+    prepared = Image.open(io.BytesIO(prepare_for_upload(large)))
+    assert prepared.format == 'JPEG'
+    assert max(prepared.size) == TARGET_SIZE
+    
+    # EXIF orientation 6 (rotate 90 degrees) is applied before re-encoding
+    exif = Image.Exif()
+    exif[0x0112] = 6
+    buffer = io.BytesIO()
+    _cached_test_image(2048, 1280, (200, 200, 200)).save(buffer, format='JPEG', exif=exif)
+    rotated = Image.open(io.BytesIO(prepare_for_upload(buffer.getvalue())))
+    assert rotated.size == (TARGET_SIZE * 1280 // 2048, TARGET_SIZE)
+    assert rotated.getexif().get(0x0112) is None
+    
+    small = _cached_test_bytes(800, 500, (200, 200, 200), 'JPEG')
+    assert prepare_for_upload(small) is small
+    assert prepare_for_upload(b"test") == b"test"
+
+
+@pytest.mark.slow
 def test_vision_analyzer_init():
     """Test vision analyzer initialization."""
     print("\n" + "=" * 60)
@@ -143,33 +218,7 @@ def test_feature_extractor():
         calculate_completeness_score
     )
     
-    # Mock vision result (simulating what Gemini would return)
-    mock_vision_result = {
-        "detected_document_type": "national_id",
-        "detected_side": "front",
-        "is_correct_document": True,
-        "document_visible": True,
-        "quality_assessment": {
-            "is_readable": True,
-            "is_blurry": False,
-            "has_glare": False,
-            "is_too_dark": False,
-            "is_too_bright": False,
-            "all_corners_visible": True,
-            "is_rotated": False,
-            "has_obstructions": False
-        },
-        "detected_elements": {
-            "has_photo": True,
-            "has_name_field": True,
-            "has_id_number": True,
-            "has_date_of_birth": True,
-            "has_expiry_date": False,
-            "has_mrz_zone": False
-        },
-        "issues_found": [],
-        "confidence_score": 0.95
-    }
+    mock_vision_result = deepcopy(MOCK_VISION_RESULT_ID)
     
     # Test 3.1: Extract ID features
     print("\n3.1 Extracting ID features...")
@@ -198,8 +247,7 @@ def test_feature_extractor():
     
     # Test 3.4: Test with passport
     print("\n3.4 Testing passport features...")
-    mock_passport = mock_vision_result.copy()
-    mock_passport['detected_elements']['has_mrz_zone'] = True
+    mock_passport = deepcopy(MOCK_VISION_RESULT_PASSPORT)
     passport_features = extract_passport_features(mock_passport)
     print(f"    Has MRZ: {passport_features['has_mrz_zone']}")
     print(f"    MRZ readable: {passport_features['mrz_readable']}")
@@ -215,28 +263,24 @@ def run_all_tests():
     print("PHASE 3: VISION ANALYZER - TEST SUITE")
     print("=" * 60)
     
-    results = []
+    tests = [
+        ("Image Processor", test_image_processor),
+        ("Vision Analyzer Init", test_vision_analyzer_init),
+        ("Feature Extractor", test_feature_extractor),
+    ]
     
-    # Test 1: Image Processor
-    try:
-        results.append(("Image Processor", test_image_processor()))
-    except Exception as e:
-        print(f" Image Processor failed: {e}")
-        results.append(("Image Processor", False))
+    def run_test(name, test):
+        try:
+            return test()
+        except Exception as e:
+            print(f" {name} failed: {e}")
+            return False
     
-    # Test 2: Vision Analyzer Init
-    try:
-        results.append(("Vision Analyzer Init", test_vision_analyzer_init()))
-    except Exception as e:
-        print(f" Vision Analyzer Init failed: {e}")
-        results.append(("Vision Analyzer Init", False))
-    
-    # Test 3: Feature Extractor
-    try:
-        results.append(("Feature Extractor", test_feature_extractor()))
-    except Exception as e:
-        print(f" Feature Extractor failed: {e}")
-        results.append(("Feature Extractor", False))
+    # Tests are independent; run them concurrently so the Gemini
+    # round-trips in the analyzer init don't block the local tests
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [(name, executor.submit(run_test, name, test)) for name, test in tests]
+        results = [(name, future.result()) for name, future in futures]
     
     # Summary
     print("\n" + "=" * 60)
@@ -260,4 +304,6 @@ def run_all_tests():
 
 
 if __name__ == "__main__":
+    # Script runs don't load conftest.py; make the project root importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     run_all_tests()
@@ -13,12 +13,15 @@ Tests:
 """
 
 import sys
-import os
 
-# Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytest
 
-from config.document_schema import DetectedIssue, IssueSeverity, IssueType
+
+@pytest.fixture(scope="module")
+def reasoner():
+    """One GeminiReasoner shared by the tests in this module."""
+    from backend.llm_reasoner import GeminiReasoner
+    return GeminiReasoner()
 
 
 def test_system_prompts():
@@ -51,7 +54,6 @@ def test_system_prompts():
     print(f"   {len(ISSUE_PROMPTS)} issue-specific prompts loaded")
     
     print(" PASSED: System prompts loading")
-    return True
 
 
 def test_issue_specific_prompts():
@@ -79,7 +81,6 @@ def test_issue_specific_prompts():
     print(f"   Unknown issue returns fallback prompt")
     
     print(" PASSED: Issue-specific prompts")
-    return True
 
 
 def test_language_templates():
@@ -115,7 +116,6 @@ def test_language_templates():
     print(f"   Unknown language falls back to English")
     
     print(" PASSED: Language templates")
-    return True
 
 
 def test_encouragement_messages():
@@ -146,18 +146,16 @@ def test_encouragement_messages():
     print(f"   Success: '{success}'")
     
     print(" PASSED: Encouragement messages")
-    return True
 
 
-def test_reasoner_initialization():
+def test_reasoner_initialization(reasoner):
     """Test LLM reasoner can be initialized."""
     print("\nTEST 5: LLM Reasoner Initialization")
     print("-" * 40)
     
-    from backend.llm_reasoner import GeminiReasoner, get_reasoner
+    from backend.llm_reasoner import get_reasoner
     
     # Test direct initialization
-    reasoner = GeminiReasoner()
     assert reasoner is not None
     assert reasoner._initialized == False  # Lazy init
     print(f"   GeminiReasoner created (lazy init)")
@@ -169,17 +167,14 @@ def test_reasoner_initialization():
     print(f"   Singleton pattern works")
     
     print(" PASSED: LLM Reasoner initialization")
-    return True
 
 
-def test_fallback_guidance():
+def test_fallback_guidance(reasoner):
     """Test fallback guidance when LLM fails."""
     print("\nTEST 6: Fallback Guidance")
     print("-" * 40)
     
-    from backend.llm_reasoner import GeminiReasoner
-    
-    reasoner = GeminiReasoner()
+    from config.document_schema import DetectedIssue, IssueSeverity, IssueType
     
     # Test with no issues
     result = reasoner._fallback_guidance([], 1)
@@ -210,7 +205,6 @@ def test_fallback_guidance():
     print(f"   Dark issue: '{result['guidance'][:50]}...'")
     
     print(" PASSED: Fallback guidance")
-    return True
 
 
 def test_response_formatter():
@@ -219,6 +213,7 @@ def test_response_formatter():
     print("-" * 40)
     
     from backend.response_formatter import ResponseFormatter, format_response
+    from config.document_schema import DetectedIssue, IssueSeverity, IssueType
     
     formatter = ResponseFormatter("en")
     
@@ -260,7 +255,6 @@ def test_response_formatter():
     print(f"   Success card: {success_card['card_type']}")
     
     print(" PASSED: Response formatter")
-    return True
 
 
 def test_mobile_formatting():
@@ -269,6 +263,7 @@ def test_mobile_formatting():
     print("-" * 40)
     
     from backend.response_formatter import ResponseFormatter
+    from config.document_schema import DetectedIssue, IssueSeverity, IssueType
     
     formatter = ResponseFormatter("en")
     
@@ -303,48 +298,15 @@ def test_mobile_formatting():
     print(f"   Success mobile: {success_mobile['progress_percent']}%")
     
     print(" PASSED: Mobile formatting")
-    return True
 
 
 def run_all_tests():
-    """Run all Phase 5 tests."""
+    """Run all Phase 5 tests (via pytest, which provides the fixtures)."""
     print("=" * 60)
     print("PHASE 5: LLM REASONER - TEST SUITE")
     print("=" * 60)
     
-    tests = [
-        test_system_prompts,
-        test_issue_specific_prompts,
-        test_language_templates,
-        test_encouragement_messages,
-        test_reasoner_initialization,
-        test_fallback_guidance,
-        test_response_formatter,
-        test_mobile_formatting
-    ]
-    
-    passed = 0
-    failed = 0
-    
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            failed += 1
-            print(f" FAILED: {test.__name__}")
-            print(f"   Error: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    print("\n" + "=" * 60)
-    if failed == 0:
-        print("All Phase 5 tests passed!")
-    else:
-        print(f"Results: {passed} passed, {failed} failed")
-    print("=" * 60)
-    
-    return failed == 0
+    return pytest.main([__file__, "-v"]) == 0
 
 
 if __name__ == "__main__":
@@ -1,140 +1,267 @@
 """Test Slice B1: Gemini OCR Service"""
-import sys
-import os
+import pytest
 
-sys.path.insert(0, r"C:\Users\tehreem.rizwan\Desktop\pet-p\hackathon\kyc-agent")
-os.chdir(r"C:\Users\tehreem.rizwan\Desktop\pet-p\hackathon\kyc-agent")
-
-print("=" * 60)
-print("SLICE B1: GEMINI OCR SERVICE - TEST")
-print("=" * 60)
-
-# Test 1: Import module
-print("TEST 1: Import ocr_service module")
 from backend.ocr_service import (
     GeminiOCR,
     OCRResult,
     DocumentQuality,
     analyze_document,
     get_call_count,
-    load_ocr_prompts
+    load_ocr_prompts,
+    results_to_columns
 )
-print("   PASSED - Module imported successfully")
-
-# Test 2: Load OCR prompts
-print("TEST 2: Load OCR prompts from config")
-prompts = load_ocr_prompts()
-print(f"  Prompts loaded: {list(prompts.keys())}")
-assert "cnic" in prompts, "Should have CNIC prompt"
-assert "aadhaar" in prompts, "Should have Aadhaar prompt"
-assert "passport" in prompts, "Should have passport prompt"
-print("   PASSED")
-
-# Test 3: GeminiOCR instantiation
-print("TEST 3: GeminiOCR class instantiation")
-ocr = GeminiOCR()
-print(f"  Configured: {ocr.is_configured()}")
-print(f"  Model: {ocr.model_name}")
-print(f"  Call count: {ocr.call_count}")
-print("   PASSED")
-
-# Test 4: OCRResult dataclass
-print("TEST 4: OCRResult dataclass")
-result = OCRResult(
-    success=True,
-    document_type="cnic",
-    quality=DocumentQuality.GOOD,
-    quality_score=80,
-    extracted_fields={"cnic_number": "12345-1234567-1", "name": "Ahmed Khan"},
-    issues=[],
-    suggestions=[],
-    raw_response="{}"
-)
-assert result.success == True
-assert result.quality == DocumentQuality.GOOD
-assert result.quality_score == 80
-assert result.extracted_fields["cnic_number"] == "12345-1234567-1"
-print("   PASSED")
-
-# Test 5: DocumentQuality enum
-print("TEST 5: DocumentQuality enum values")
-assert DocumentQuality.EXCELLENT.value == "excellent"
-assert DocumentQuality.GOOD.value == "good"
-assert DocumentQuality.ACCEPTABLE.value == "acceptable"
-assert DocumentQuality.POOR.value == "poor"
-assert DocumentQuality.UNREADABLE.value == "unreadable"
-print("   PASSED")
-
-# Test 6: extract_field_value method
-print("TEST 6: extract_field_value method")
-extracted = {"cnic_number": "12345-1234567-1", "name": "Ahmed Khan"}
-value, valid = ocr.extract_field_value(extracted, "cnic_number", r"^\d{5}-\d{7}-\d{1}$")
-assert value == "12345-1234567-1"
-assert valid == True
-print(f"  CNIC extracted: {value}, valid: {valid} ")
-
-value, valid = ocr.extract_field_value(extracted, "missing_field")
-assert value is None
-assert valid == False
-print(f"  Missing field: {value}, valid: {valid} ")
-
-# Test 7: compare_with_form method
-print("TEST 7: compare_with_form method")
-extracted_fields = {
+
+
+@pytest.fixture(scope="module")
+def ocr():
+    """One GeminiOCR instance shared by the module's tests."""
+    return GeminiOCR()
+
+
+@pytest.fixture(scope="module")
+def prompts():
+    """OCR prompts loaded from config once for the module."""
+    return load_ocr_prompts()
+
+
+@pytest.mark.parametrize("document_type", ["cnic", "aadhaar", "passport"])
+def test_load_ocr_prompts(prompts, document_type):
+    """TEST 2: Load OCR prompts from config"""
+    assert document_type in prompts, f"Should have {document_type} prompt"
+
+
+def test_gemini_ocr_instantiation(ocr):
+    """TEST 3: GeminiOCR class instantiation"""
+    assert ocr.model_name in GeminiOCR.GEMINI_MODELS
+    assert ocr.call_count == 0
+
+
+def test_ocr_result_dataclass():
+    """TEST 4: OCRResult dataclass"""
+    result = OCRResult(
+        success=True,
+        document_type="cnic",
+        quality=DocumentQuality.GOOD,
+        quality_score=80,
+        extracted_fields={"cnic_number": "12345-1234567-1", "name": "Ahmed Khan"},
+        issues=[],
+        suggestions=[],
+        raw_response="{}"
+    )
+    assert result.success == True
+    assert result.quality == DocumentQuality.GOOD
+    assert result.quality_score == 80
+    assert result.extracted_fields["cnic_number"] == "12345-1234567-1"
+
+
+@pytest.mark.parametrize("quality, value", [
+    (DocumentQuality.EXCELLENT, "excellent"),
+    (DocumentQuality.GOOD, "good"),
+    (DocumentQuality.ACCEPTABLE, "acceptable"),
+    (DocumentQuality.POOR, "poor"),
+    (DocumentQuality.UNREADABLE, "unreadable"),
+])
+def test_document_quality_enum(quality, value):
+    """TEST 5: DocumentQuality enum values"""
+    assert quality.value == value
+
+
+def test_extract_field_value(ocr):
+    """TEST 6: extract_field_value method"""
+    extracted = {"cnic_number": "12345-1234567-1", "name": "Ahmed Khan"}
+    value, valid = ocr.extract_field_value(extracted, "cnic_number", r"^\d{5}-\d{7}-\d{1}$")
+    assert value == "12345-1234567-1"
+    assert valid == True
+
+    value, valid = ocr.extract_field_value(extracted, "missing_field")
+    assert value is None
+    assert valid == False
+
+
+EXTRACTED_FIELDS = {
     "cnic_number": "12345-1234567-1",
     "name": "Ahmed Khan",
     "date_of_birth": "1990-01-15"
 }
-form_data = {
-    "cnic": "12345-1234567-1",
-    "full_name": "Ahmed Khan",
-    "date_of_birth": "1990-01-15"
-}
-all_match, mismatches = ocr.compare_with_form(extracted_fields, form_data, "PK")
-print(f"  All match: {all_match}, Mismatches: {len(mismatches)}")
-assert all_match == True
-print("   PASSED")
-
-# Test 8: compare_with_form - mismatch detection
-print("TEST 8: compare_with_form - mismatch detection")
-form_data_wrong = {
-    "cnic": "99999-9999999-9",  # Different CNIC
-    "full_name": "Ahmed Khan",
-    "date_of_birth": "1990-01-15"
-}
-all_match, mismatches = ocr.compare_with_form(extracted_fields, form_data_wrong, "PK")
-print(f"  All match: {all_match}, Mismatches: {len(mismatches)}")
-assert all_match == False
-assert len(mismatches) >= 1
-print(f"  Mismatch: {mismatches[0]['field']} - {mismatches[0]['message']} ")
-
-# Test 9: Prompt building
-print("TEST 9: Prompt building")
-prompt = ocr._build_prompt("cnic", "PK", "front")
-assert "cnic" in prompt.lower()
-assert "PK" in prompt
-assert "JSON" in prompt
-print(f"  Prompt length: {len(prompt)} chars ")
-
-# Test 10: Parse unstructured response
-print("TEST 10: Parse unstructured response fallback")
-response_text = "The document is blurry and the text is not readable. Please retake the photo."
-result = ocr._parse_unstructured_response(response_text, "cnic")
-assert result.quality == DocumentQuality.POOR
-assert result.quality_score < 50
-assert len(result.issues) > 0
-print(f"  Quality: {result.quality.value}, Score: {result.quality_score} ")
-print(f"  Issues: {[i['type'] for i in result.issues]} ")
-
-# Test 11: API not configured handling
-print("TEST 11: API not configured handling")
-ocr_no_key = GeminiOCR(api_key="")
-assert ocr_no_key.is_configured() == False
-result = ocr_no_key.analyze_document(b"test", "cnic", "PK", "front")
-assert result.success == False
-assert "not configured" in result.error_message.lower()
-print(f"  Error: {result.error_message} ")
-
-print("=" * 60)
-print("SLICE B1 COMPLETE - All tests passed!")
-print("=" * 60)
+
+
+def test_compare_with_form(ocr):
+    """TEST 7: compare_with_form method"""
+    form_data = {
+        "cnic": "12345-1234567-1",
+        "full_name": "Ahmed Khan",
+        "date_of_birth": "1990-01-15"
+    }
+    all_match, mismatches = ocr.compare_with_form(EXTRACTED_FIELDS, form_data, "PK")
+    assert all_match == True
+
+
+def test_compare_with_form_mismatch(ocr):
+    """TEST 8: compare_with_form - mismatch detection"""
+    form_data_wrong = {
+        "cnic": "99999-9999999-9",  # Different CNIC
+        "full_name": "Ahmed Khan",
+        "date_of_birth": "1990-01-15"
+    }
+    all_match, mismatches = ocr.compare_with_form(EXTRACTED_FIELDS, form_data_wrong, "PK")
+    assert all_match == False
+    assert len(mismatches) >= 1
+
+
+def test_compare_with_form_name_variation(ocr):
+    """TEST 8b: compare_with_form - small name spelling differences tolerated"""
+    form_data = {
+        "cnic": "12345-1234567-1",
+        "full_name": "Ahmad Khan",  # One letter off from the document
+        "date_of_birth": "1990-01-15"
+    }
+    all_match, mismatches = ocr.compare_with_form(EXTRACTED_FIELDS, form_data, "PK")
+    assert all_match == True, mismatches
+
+    form_data["cnic"] = "１２３４５-１２３４５６７-１"  # Full-width digits
+    all_match, mismatches = ocr.compare_with_form(EXTRACTED_FIELDS, form_data, "PK")
+    assert all_match == True, mismatches
+
+    form_data["full_name"] = "Bilal Khan"
+    all_match, mismatches = ocr.compare_with_form(EXTRACTED_FIELDS, form_data, "PK")
+    assert all_match == False
+    assert mismatches[0]["field"] == "full_name"
+
+
+def test_analyze_documents_batch_keeps_order(monkeypatch):
+    """TEST 8c: analyze_documents_batch returns results in input order"""
+    ocr = GeminiOCR()
+
+    def fake_analyze(image_bytes, document_type, country_code, side):
+        return OCRResult(
+            success=True,
+            document_type=document_type,
+            quality=DocumentQuality.GOOD,
+            quality_score=len(image_bytes),
+            extracted_fields={"side": side},
+            issues=[],
+            suggestions=[],
+            raw_response="{}"
+        )
+
+    monkeypatch.setattr(ocr, "analyze_document", fake_analyze)
+    items = [(b"x" * n, "cnic", "PK", "front" if n % 2 else "back") for n in range(1, 6)]
+    results = ocr.analyze_documents_batch(items, max_concurrency=3)
+    assert [r.quality_score for r in results] == [1, 2, 3, 4, 5]
+    assert ocr.analyze_documents_batch([]) == []
+
+
+def test_analyze_documents_batch_keeps_errors_apart(monkeypatch):
+    """TEST 8c-2: each failed batch item reports its own API error"""
+    from collections import OrderedDict
+    monkeypatch.setattr("backend.ocr_service._RESULT_CACHE", OrderedDict())
+    ocr = GeminiOCR(api_key="test-key")
+    errors = {
+        b"quota": "429 RESOURCE_EXHAUSTED: quota exceeded",
+        b"broken": "500 INTERNAL: backend error",
+    }
+
+    def fake_call(prompt, image_bytes):
+        return None, errors[image_bytes]
+
+    monkeypatch.setattr(ocr, "_call_with_retry", fake_call)
+    items = [(key, "cnic", "PK", "front") for key in (b"quota", b"broken") * 4]
+    results = ocr.analyze_documents_batch(items, max_concurrency=8)
+
+    for (image_bytes, *_), result in zip(items, results):
+        assert result.success == False
+        if image_bytes == b"quota":
+            assert result.issues[0]["type"] == "RATE_LIMIT"
+        else:
+            assert result.issues[0]["type"] == "ERROR"
+            assert result.error_message == errors[b"broken"]
+
+
+def test_compare_batch_with_forms(ocr):
+    """TEST 8d: batch comparison matches compare_with_form per item"""
+    def make_result(fields):
+        return OCRResult(
+            success=True,
+            document_type="cnic",
+            quality=DocumentQuality.GOOD,
+            quality_score=80,
+            extracted_fields=fields,
+            issues=[],
+            suggestions=[],
+            raw_response="{}"
+        )
+
+    results = [make_result(EXTRACTED_FIELDS), make_result(EXTRACTED_FIELDS), make_result({})]
+    forms = [
+        {"cnic": "12345-1234567-1", "full_name": "Ahmed Khan", "date_of_birth": "1990-01-15"},
+        {"cnic": "99999-9999999-9", "full_name": "Bilal Khan", "date_of_birth": "1990-01-15"},
+        {"cnic": "12345-1234567-1"},
+    ]
+    batch = ocr.compare_batch_with_forms(results, forms, "PK")
+    assert batch == [ocr.compare_with_form(r.extracted_fields, f, "PK") for r, f in zip(results, forms)]
+    assert [all_match for all_match, _ in batch] == [True, False, True]
+
+    columns = results_to_columns(results)
+    assert columns["name"] == ["Ahmed Khan", "Ahmed Khan", None]
+
+
+def test_analyze_document_caches_identical_images(monkeypatch):
+    """TEST 8e: a repeated image is answered from the cache, without another API call"""
+    from collections import OrderedDict
+    monkeypatch.setattr("backend.ocr_service._RESULT_CACHE", OrderedDict())
+    ocr = GeminiOCR(api_key="test-key")
+    calls = []
+
+    def fake_call(prompt, image_bytes):
+        calls.append(image_bytes)
+        return (
+            '{"document_detected": true, "is_valid_document_type": true,'
+            ' "extracted_fields": {"name": "Ahmed Khan"},'
+            ' "quality_assessment": {"overall_quality": "good", "quality_score": 80}}'
+        ), None
+
+    monkeypatch.setattr(ocr, "_call_with_retry", fake_call)
+    first = ocr.analyze_document(b"same photo", "cnic", "PK", "front")
+    first.issues.append({"type": "BILL_EXPIRED"})  # Callers may add issues to a result
+    second = ocr.analyze_document(b"same photo", "cnic", "PK", "front")
+    assert len(calls) == 1
+    assert second.extracted_fields == {"name": "Ahmed Khan"}
+    assert {"type": "BILL_EXPIRED"} not in second.issues
+
+    # The cache is shared by every instance; the app builds one per upload
+    other = GeminiOCR(api_key="test-key")
+    monkeypatch.setattr(other, "_call_with_retry", fake_call)
+    assert other.analyze_document(b"same photo", "cnic", "PK", "front").success == True
+    assert len(calls) == 1
+
+    ocr.analyze_document(b"same photo", "cnic", "PK", "back")
+    ocr.analyze_document(b"other photo", "cnic", "PK", "front")
+    assert len(calls) == 3
+
+
+def test_prompt_building(ocr):
+    """TEST 9: Prompt building"""
+    prompt = ocr._build_prompt("cnic", "PK", "front")
+    assert "cnic" in prompt.lower()
+    assert "PK" in prompt
+    assert "JSON" in prompt
+
+
+def test_parse_unstructured_response(ocr):
+    """TEST 10: Parse unstructured response fallback"""
+    response_text = "The document is blurry and the text is not readable. Please retake the photo."
+    result = ocr._parse_unstructured_response(response_text, "cnic")
+    assert result.quality == DocumentQuality.POOR
+    assert result.quality_score < 50
+    assert len(result.issues) > 0
+
+
+def test_api_not_configured(monkeypatch):
+    """TEST 11: API not configured handling"""
+    # GeminiOCR falls back to the environment key, which the settings require
+    monkeypatch.setattr("backend.ocr_service.GEMINI_API_KEY", "")
+    ocr_no_key = GeminiOCR(api_key="")
+    assert ocr_no_key.is_configured() == False
+    result = ocr_no_key.analyze_document(b"test", "cnic", "PK", "front")
+    assert result.success == False
+    assert result.error_message == "No API key configured"